@@ -16,14 +16,14 @@ This provides an interactive complement to the static HTML report.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import json
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# Plotly is imported inside the chart functions that use it so that cold
+# starts and text-only views do not pay for loading it
+
 # Page configuration
 st.set_page_config(
     page_title="UNICEF Health Services Analysis",
@@ -47,13 +47,90 @@ st.markdown("""
         border-radius: 0.5rem;
         border-left: 4px solid #1f77b4;
     }
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+    }
+    .metric-label {
+        font-size: 0.875rem;
+        color: #31333f;
+    }
+    .metric-value {
+        font-size: 2rem;
+        font-weight: 600;
+    }
+    .metric-delta {
+        font-size: 0.875rem;
+        color: #09ab3b;
+    }
     .sidebar .sidebar-content {
         background-color: #f8f9fa;
     }
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+# Full display names for the indicator codes
+INDICATOR_NAMES = {
+    'MNCH_ANC4': 'Antenatal Care (4+ visits)',
+    'MNCH_SAB': 'Skilled Birth Attendance'
+}
+
+# Columns and dtypes read from the merged dataset
+MERGED_DATA_DTYPES = {
+    'country_name': 'category',
+    'indicator': 'category',
+    'u5mr_status': 'category',
+    'year': 'int16',
+    'coverage_value': 'float32',
+    'births_2022': 'float32'
+}
+
+def weighted_mean(aggregates, mask):
+    """Births-weighted mean coverage over the masked aggregate rows."""
+    den = aggregates['births'][mask].sum()
+    return aggregates['weighted_coverage'][mask].sum() / den if den > 0 else np.nan
+
+# Scatter marker sizes (px) for coverage below 25%, 25-50%, 50-75% and 75%+
+MARKER_SIZES = np.array([6, 9, 12, 15], dtype=np.int8)
+MARKER_SIZE_BINS = [25, 50, 75]
+
+def build_comparison_df(results):
+    """Build the coverage-by-status bar-chart data from the analysis results."""
+    data = []
+    for indicator in ['MNCH_ANC4', 'MNCH_SAB']:
+        for status in ['on_track', 'off_track']:
+            if status in results['by_status'] and indicator in results['by_status'][status]:
+                data.append({
+                    'Indicator': INDICATOR_NAMES[indicator],
+                    'Status': status.replace('_', ' ').title(),
+                    'Coverage': results['by_status'][status][indicator]['births_weighted_avg'],
+                    'Countries': results['by_status'][status][indicator]['num_countries']
+                })
+    
+    return pd.DataFrame(data)
+
+def build_weighted_vs_simple_df(results):
+    """Build the births-weighted vs simple average bar-chart data."""
+    data = []
+    for indicator, metrics in results['overall_coverage'].items():
+        data.append({
+            'Indicator': INDICATOR_NAMES[indicator],
+            'Method': 'Births-Weighted',
+            'Coverage': metrics['births_weighted_avg']
+        })
+        data.append({
+            'Indicator': INDICATOR_NAMES[indicator],
+            'Method': 'Simple Average',
+            'Coverage': metrics['simple_avg']
+        })
+    
+    return pd.DataFrame(data)
+
+# Cached as a shared resource so reruns get the same objects back without a
+# pickle round-trip. Callers must treat the returned results, frame and
+# precomputed arrays as read-only and never mutate them in place.
+@st.cache_resource
 def load_analysis_data():
     """Load the analysis results and data."""
     try:
@@ -61,25 +138,82 @@ def load_analysis_data():
         with open('data/output/analysis_results.json', 'r') as f:
             results = json.load(f)
         
-        # Load merged dataset
-        df = pd.read_csv('data/output/final_merged_dataset.csv')
+        # Load merged dataset, reading only the columns the dashboard uses.
+        # Numerics are downcast and text columns dictionary-encoded to shrink
+        # the frame and the payloads sent to Plotly and the browser
+        parquet_path = Path('data/output/final_merged_dataset.parquet')
+        if parquet_path.exists():
+            # Columnar file written by run_analysis.py; categoricals come back as-is
+            df = pd.read_parquet(
+                parquet_path,
+                columns=list(MERGED_DATA_DTYPES)
+            ).astype(MERGED_DATA_DTYPES)
+        else:
+            df = pd.read_csv(
+                'data/output/final_merged_dataset.csv',
+                engine='pyarrow',
+                usecols=list(MERGED_DATA_DTYPES),
+                dtype=MERGED_DATA_DTYPES
+            )
         
         # Exclude NaN values from U5MR status
         df = df.dropna(subset=['u5mr_status'])
         
-        # Create indicator mapping for full names
-        indicator_mapping = {
-            'MNCH_ANC4': 'Antenatal Care (4+ visits)',
-            'MNCH_SAB': 'Skilled Birth Attendance'
-        }
-        
         # Add full indicator names
-        df['indicator_full_name'] = df['indicator'].map(indicator_mapping)
+        df['indicator_full_name'] = df['indicator'].map(INDICATOR_NAMES)
+        
+        # Category codes let the explorer build its masks on small integer
+        # arrays instead of re-hashing strings every rerun
+        df['indicator_full_name'] = df['indicator_full_name'].astype('category')
+        
+        status_categories = df['u5mr_status'].cat.categories
+        indicator_categories = df['indicator_full_name'].cat.categories
+        
+        # Births-weighted sums per (indicator, status, year, country) from the rollups
+        # written by run_analysis.py; outputs without them fall back to the merged rows
+        aggregates_path = Path('data/output/aggregates.parquet')
+        if aggregates_path.exists():
+            agg = pd.read_parquet(aggregates_path)
+            agg_status, agg_indicator, agg_years = agg['u5mr_status'], agg['indicator'], agg['year']
+            births = agg['births'].to_numpy(dtype=np.float64)
+            weighted_coverage = agg['coverage'].to_numpy(dtype=np.float64) * births
+        else:
+            agg_status, agg_indicator, agg_years = df['u5mr_status'], df['indicator'], df['year']
+            births = df['births_2022'].to_numpy(dtype=np.float64)
+            weighted_coverage = df['coverage_value'].to_numpy(dtype=np.float64) * births
+        
+        precomputed = {
+            'status_codes': df['u5mr_status'].cat.codes.to_numpy(),
+            'status_categories': status_categories,
+            'indicator_codes': df['indicator_full_name'].cat.codes.to_numpy(),
+            'indicator_categories': indicator_categories,
+            'years': df['year'].to_numpy(),
+            # Sidebar widget options and slider bounds
+            'status_options': tuple(df['u5mr_status'].cat.categories),
+            'indicator_options': tuple(df['indicator_full_name'].cat.categories),
+            'year_range': (int(df['year'].min()), int(df['year'].max())),
+            # Aggregate rows coded against the same categories, so filter_explorer_mask
+            # applies to them unchanged; read by weighted_mean and the births total
+            'aggregates': {
+                'status_codes': status_categories.get_indexer(agg_status.astype(str)),
+                'status_categories': status_categories,
+                'indicator_codes': indicator_categories.get_indexer(agg_indicator.astype(str).map(INDICATOR_NAMES)),
+                'indicator_categories': indicator_categories,
+                'years': agg_years.to_numpy(),
+                'births': births,
+                'weighted_coverage': weighted_coverage
+            },
+            # Filter on the short indicator codes rather than the mapped names
+            'anc4_sba_df': df.loc[df['indicator'].isin(['MNCH_ANC4', 'MNCH_SAB'])].reset_index(drop=True),
+            # Bar-chart frames are constant for a given results file
+            'comparison_df': build_comparison_df(results),
+            'weighted_vs_simple_df': build_weighted_vs_simple_df(results)
+        }
         
-        return results, df
+        return results, df, precomputed
     except Exception as e:
         st.error(f"Error loading data: {e}")
-        return None, None
+        return None, None, None
 
 def create_header():
     """Create the main header."""
@@ -133,64 +267,28 @@ def display_overview_metrics(results):
     st.markdown("---")
     st.subheader("Key Findings Overview")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            label="Antenatal Care (4+ visits) Coverage",
-            value=f"{results['overall_coverage']['MNCH_ANC4']['births_weighted_avg']:.1f}%",
-            delta="vs Simple Average"
-        )
-    
-    with col2:
-        st.metric(
-            label="Skilled Birth Attendance Coverage",
-            value=f"{results['overall_coverage']['MNCH_SAB']['births_weighted_avg']:.1f}%",
-            delta="vs Simple Average"
-        )
-    
-    with col3:
-        st.metric(
-            label="Countries Analyzed",
-            value=f"{results['summary']['unique_countries']}",
-            delta="Total Countries"
-        )
+    metrics = [
+        ("Antenatal Care (4+ visits) Coverage",
+         f"{results['overall_coverage']['MNCH_ANC4']['births_weighted_avg']:.1f}%", "vs Simple Average"),
+        ("Skilled Birth Attendance Coverage",
+         f"{results['overall_coverage']['MNCH_SAB']['births_weighted_avg']:.1f}%", "vs Simple Average"),
+        ("Countries Analyzed", f"{results['summary']['unique_countries']}", "Total Countries"),
+        ("Total Births (2022)", f"{results['summary']['total_births']:,.0f}", "Covered")
+    ]
     
-    with col4:
-        st.metric(
-            label="Total Births (2022)",
-            value=f"{results['summary']['total_births']:,.0f}",
-            delta="Covered"
-        )
+    # Render all four cards as one HTML block instead of four metric widgets
+    cards = "".join(
+        f'<div class="metric-card"><div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{value}</div><div class="metric-delta">{delta}</div></div>'
+        for label, value, delta in metrics
+    )
+    st.markdown(f'<div class="metric-grid">{cards}</div>', unsafe_allow_html=True)
 
-def create_coverage_comparison_chart(results, chart_key="coverage_comparison"):
-    """Create interactive coverage comparison chart."""
-    st.subheader("Coverage Comparison by U5MR Status")
-    
-    # Prepare data for plotting
-    indicators = ['MNCH_ANC4', 'MNCH_SAB']
-    statuses = ['on_track', 'off_track']
-    
-    # Create indicator mapping for full names
-    indicator_mapping = {
-        'MNCH_ANC4': 'Antenatal Care (4+ visits)',
-        'MNCH_SAB': 'Skilled Birth Attendance'
-    }
-    
-    data = []
-    for indicator in indicators:
-        for status in statuses:
-            if status in results['by_status'] and indicator in results['by_status'][status]:
-                data.append({
-                    'Indicator': indicator_mapping[indicator],
-                    'Status': status.replace('_', ' ').title(),
-                    'Coverage': results['by_status'][status][indicator]['births_weighted_avg'],
-                    'Countries': results['by_status'][status][indicator]['num_countries']
-                })
-    
-    df_plot = pd.DataFrame(data)
+@st.cache_data
+def build_comparison_fig(df_plot) -> dict:
+    """Build the coverage-by-status bar chart as a figure dict."""
+    import plotly.express as px
     
-    # Create interactive bar chart
     fig = px.bar(
         df_plot,
         x='Indicator',
@@ -213,7 +311,19 @@ def create_coverage_comparison_chart(results, chart_key="coverage_comparison"):
         height=500
     )
     
-    st.plotly_chart(fig, use_container_width=True, key=chart_key)
+    return fig.to_dict()
+
+def show_figure(fig_dict, **kwargs):
+    """Render a cached figure dict, rebuilt as a go.Figure so empty traces are accepted."""
+    import plotly.graph_objects as go
+    st.plotly_chart(go.Figure(fig_dict), use_container_width=True, **kwargs)
+
+def create_coverage_comparison_chart(df_plot, chart_key="coverage_comparison"):
+    """Create interactive coverage comparison chart."""
+    st.subheader("Coverage Comparison by U5MR Status")
+    
+    # Create interactive bar chart
+    show_figure(build_comparison_fig(df_plot), key=chart_key)
     
     # Display detailed statistics
     col1, col2 = st.columns(2)
@@ -221,39 +331,17 @@ def create_coverage_comparison_chart(results, chart_key="coverage_comparison"):
     with col1:
         st.markdown("**Antenatal Care (4+ visits):**")
         anc4_data = df_plot[df_plot['Indicator'] == 'Antenatal Care (4+ visits)']
-        for _, row in anc4_data.iterrows():
-            st.write(f"- {row['Status']}: {row['Coverage']:.1f}% ({row['Countries']} countries)")
+        st.table(anc4_data[['Status', 'Coverage', 'Countries']].set_index('Status').round(1))
     
     with col2:
         st.markdown("**Skilled Birth Attendance:**")
         sba_data = df_plot[df_plot['Indicator'] == 'Skilled Birth Attendance']
-        for _, row in sba_data.iterrows():
-            st.write(f"- {row['Status']}: {row['Coverage']:.1f}% ({row['Countries']} countries)")
+        st.table(sba_data[['Status', 'Coverage', 'Countries']].set_index('Status').round(1))
 
-def create_weighted_vs_simple_chart(results):
-    """Create comparison of births-weighted vs simple averages."""
-    st.subheader("Births-Weighted vs Simple Averages")
-    
-    # Create indicator mapping for full names
-    indicator_mapping = {
-        'MNCH_ANC4': 'Antenatal Care (4+ visits)',
-        'MNCH_SAB': 'Skilled Birth Attendance'
-    }
-    
-    data = []
-    for indicator, metrics in results['overall_coverage'].items():
-        data.append({
-            'Indicator': indicator_mapping[indicator],
-            'Method': 'Births-Weighted',
-            'Coverage': metrics['births_weighted_avg']
-        })
-        data.append({
-            'Indicator': indicator_mapping[indicator],
-            'Method': 'Simple Average',
-            'Coverage': metrics['simple_avg']
-        })
-    
-    df_plot = pd.DataFrame(data)
+@st.cache_data
+def build_weighted_vs_simple_fig(df_plot) -> dict:
+    """Build the weighting-method comparison bar chart as a figure dict."""
+    import plotly.express as px
     
     fig = px.bar(
         df_plot,
@@ -276,7 +364,13 @@ def create_weighted_vs_simple_chart(results):
         height=500
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_dict()
+
+def create_weighted_vs_simple_chart(df_plot):
+    """Create comparison of births-weighted vs simple averages."""
+    st.subheader("Births-Weighted vs Simple Averages")
+    
+    show_figure(build_weighted_vs_simple_fig(df_plot))
     
     # Calculate differences
     st.markdown("**Key Insights:**")
@@ -288,30 +382,107 @@ def create_weighted_vs_simple_chart(results):
             diff = weighted - simple
             st.write(f"- **{indicator}:** Births-weighted ({weighted:.1f}%) vs Simple ({simple:.1f}%) = {diff:+.1f}% difference")
 
-def create_country_explorer(df):
+def create_coverage_births_scatter(df, title, color_map=None):
+    """Build a WebGL coverage-vs-births scatter with one trace per indicator."""
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    
+    # Four discrete marker sizes by 25-point coverage band, binned server-side
+    # so plotly.js can skip its per-point sizing pass
+    sizes = np.take(MARKER_SIZES, np.digitize(df['coverage_value'].to_numpy(), MARKER_SIZE_BINS))
+    
+    for indicator in df['indicator_full_name'].unique():
+        in_subset = (df['indicator_full_name'] == indicator).to_numpy()
+        subset = df[in_subset]
+        customdata = np.stack([
+            subset['country_name'].astype(str).to_numpy(),
+            subset['u5mr_status'].astype(str).to_numpy(),
+            subset['year'].to_numpy()
+        ], axis=1)
+        
+        marker = dict(size=sizes[in_subset])
+        if color_map and indicator in color_map:
+            marker['color'] = color_map[indicator]
+        
+        fig.add_trace(go.Scattergl(
+            x=subset['births_2022'].to_numpy(),
+            y=subset['coverage_value'].to_numpy(),
+            mode='markers',
+            name=str(indicator),
+            marker=marker,
+            customdata=customdata,
+            hovertemplate=(
+                "<b>%{customdata[0]}</b><br>"
+                "Births (2022): %{x:,.0f}<br>"
+                "Coverage (%): %{y:.1f}<br>"
+                "U5MR Status: %{customdata[1]}<br>"
+                "Year: %{customdata[2]}<extra></extra>"
+            )
+        ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title='Births (2022)',
+        yaxis_title='Coverage (%)',
+        legend_title='Indicator',
+        height=500
+    )
+    return fig
+
+def filter_explorer_mask(precomputed, status_tuple, indicator_tuple, y0, y1):
+    """Build the explorer row mask on the precomputed category code arrays."""
+    years = precomputed['years']
+    return (
+        np.isin(precomputed['status_codes'], precomputed['status_categories'].get_indexer(status_tuple)) &
+        np.isin(precomputed['indicator_codes'], precomputed['indicator_categories'].get_indexer(indicator_tuple)) &
+        (years >= y0) &
+        (years <= y1)
+    )
+
+def filter_explorer_data(df, precomputed, status_tuple, indicator_tuple, y0, y1):
+    """Filter the merged data on the precomputed category code arrays."""
+    return df.iloc[filter_explorer_mask(precomputed, status_tuple, indicator_tuple, y0, y1)]
+
+@st.cache_data
+def build_scatter_fig(status_tuple, indicator_tuple, y0, y1, _df, _precomputed) -> dict:
+    """Build the explorer scatter for a filter state and return it as a figure dict."""
+    filtered_df = filter_explorer_data(_df, _precomputed, status_tuple, indicator_tuple, y0, y1)
+    fig = create_coverage_births_scatter(
+        filtered_df,
+        "Coverage vs Births by Country",
+        color_map={
+            'Antenatal Care (4+ visits)': '#1f77b4',
+            'Skilled Birth Attendance': '#ff7f0e'
+        }
+    )
+    return fig.to_dict()
+
+def create_country_explorer(df, precomputed):
     """Create interactive country-level data explorer."""
     st.subheader("Country-Level Data Explorer")
     
+    status_options = precomputed['status_options']
+    indicator_options = precomputed['indicator_options']
+    
     # Sidebar filters
     st.sidebar.markdown("### Filters")
     
     # U5MR Status filter
     status_filter = st.sidebar.multiselect(
         "U5MR Status:",
-        options=df['u5mr_status'].unique(),
-        default=df['u5mr_status'].unique()
+        options=status_options,
+        default=status_options
     )
     
     # Indicator filter
     indicator_filter = st.sidebar.multiselect(
         "Indicator:",
-        options=df['indicator_full_name'].unique(),
-        default=df['indicator_full_name'].unique()
+        options=indicator_options,
+        default=indicator_options
     )
     
     # Year filter
-    min_year = int(df['year'].min())
-    max_year = int(df['year'].max())
+    min_year, max_year = precomputed['year_range']
     year_filter = st.sidebar.slider(
         "Year Range:",
         min_value=min_year,
@@ -319,13 +490,12 @@ def create_country_explorer(df):
         value=(min_year, max_year)
     )
     
-    # Apply filters
-    filtered_df = df[
-        (df['u5mr_status'].isin(status_filter)) &
-        (df['indicator_full_name'].isin(indicator_filter)) &
-        (df['year'] >= year_filter[0]) &
-        (df['year'] <= year_filter[1])
-    ]
+    # Hashable filter state, shared by the data filter and the figure cache
+    filter_state = (tuple(status_filter), tuple(indicator_filter), year_filter[0], year_filter[1])
+    mask = filter_explorer_mask(precomputed, *filter_state)
+    filtered_df = df.iloc[mask]
+    aggregates = precomputed['aggregates']
+    aggregates_mask = filter_explorer_mask(aggregates, *filter_state)
     
     # Display filtered data
     col1, col2 = st.columns([2, 1])
@@ -334,27 +504,7 @@ def create_country_explorer(df):
         st.markdown(f"**Showing {len(filtered_df)} records**")
         
         # Create scatter plot
-        fig = px.scatter(
-            filtered_df,
-            x='births_2022',
-            y='coverage_value',
-            color='indicator_full_name',
-            size='coverage_value',
-            hover_data=['country_name', 'u5mr_status', 'year'],
-            title="Coverage vs Births by Country",
-            labels={
-                'births_2022': 'Births (2022)',
-                'coverage_value': 'Coverage (%)',
-                'indicator_full_name': 'Indicator'
-            },
-            color_discrete_map={
-                'Antenatal Care (4+ visits)': '#1f77b4',
-                'Skilled Birth Attendance': '#ff7f0e'
-            }
-        )
-        
-        fig.update_layout(height=500)
-        st.plotly_chart(fig, use_container_width=True)
+        show_figure(build_scatter_fig(*filter_state, df, precomputed))
     
     with col2:
         st.markdown("**Summary Statistics:**")
@@ -362,27 +512,105 @@ def create_country_explorer(df):
         # Coverage statistics
         st.metric("Average Coverage", f"{filtered_df['coverage_value'].mean():.1f}%")
         st.metric("Median Coverage", f"{filtered_df['coverage_value'].median():.1f}%")
-        st.metric("Total Births", f"{filtered_df['births_2022'].sum():,.0f}")
-        
-        # Status distribution
-        st.markdown("**Status Distribution:**")
-        status_counts = filtered_df['u5mr_status'].value_counts()
-        for status, count in status_counts.items():
-            st.write(f"- {status}: {count} records")
-        
-        # Indicator distribution
-        st.markdown("**Indicator Distribution:**")
-        indicator_counts = filtered_df['indicator_full_name'].value_counts()
-        for indicator, count in indicator_counts.items():
-            st.write(f"- {indicator}: {count} records")
+        st.metric("Births-Weighted Coverage", f"{weighted_mean(aggregates, aggregates_mask):.1f}%")
+        st.metric("Total Births", f"{aggregates['births'][aggregates_mask].sum():,.0f}")
+        
+        # Record counts by status, stacked by indicator, in a single chart
+        st.markdown("**Records by Status and Indicator:**")
+        counts_df = filtered_df.groupby(
+            ['u5mr_status', 'indicator_full_name'], observed=True
+        ).size().unstack(fill_value=0)
+        # Plain string axes: categorical column labels do not round-trip through Arrow
+        counts_df.index = counts_df.index.astype(str)
+        counts_df.columns = counts_df.columns.astype(str)
+        st.bar_chart(counts_df, height=250)
+
+@st.cache_data
+def compute_indicator_summary(_df, df_key):
+    """Summarize coverage by indicator; `df_key` fingerprints the unhashed frame."""
+    coverage = _df.groupby('indicator_full_name', observed=True).agg(
+        mean=('coverage_value', 'mean'),
+        median=('coverage_value', 'median'),
+        min=('coverage_value', 'min'),
+        max=('coverage_value', 'max'),
+        countries=('country_name', 'nunique')
+    )
+    status_means = (
+        _df.groupby(['indicator_full_name', 'u5mr_status'], observed=True)['coverage_value']
+        .mean()
+        .unstack()
+        .reindex(index=coverage.index, columns=['on_track', 'off_track'])
+    )
+    
+    def fmt(values):
+        return [f"{value:.1f}" for value in values]
+    
+    return pd.DataFrame({
+        'Indicator': coverage.index.astype(str),
+        'Average Coverage (%)': fmt(coverage['mean']),
+        'Median Coverage (%)': fmt(coverage['median']),
+        'Countries with Data': coverage['countries'].to_numpy(),
+        'Coverage Range (%)': [f"{lo:.1f} - {hi:.1f}" for lo, hi in zip(coverage['min'], coverage['max'])],
+        'On-track Average (%)': fmt(status_means['on_track']),
+        'Off-track Average (%)': fmt(status_means['off_track'])
+    })
 
-def create_anc4_sba_coverage_analysis(df):
+@st.cache_data
+def build_anc4_sba_figures(_df, df_key):
+    """Build the ANC4/SBA analysis figures; `df_key` fingerprints the unhashed frame."""
+    import plotly.express as px
+    
+    box_fig = px.box(
+        _df,
+        x='indicator_full_name',
+        y='coverage_value',
+        color='u5mr_status',
+        title="Coverage Distribution by U5MR Status",
+        labels={
+            'coverage_value': 'Coverage (%)',
+            'indicator_full_name': 'Indicator',
+            'u5mr_status': 'U5MR Status'
+        }
+    )
+    box_fig.update_layout(height=500)
+    
+    # Sorted by year then indicator so the legend order stays ANC4, SBA
+    year_dist = (
+        _df.value_counts(['year', 'indicator_full_name'])
+        .sort_index()
+        .rename('count')
+        .reset_index()
+    )
+    year_fig = px.bar(
+        year_dist,
+        x='year',
+        y='count',
+        color='indicator_full_name',
+        title="Number of Countries with Estimates by Year",
+        labels={
+            'count': 'Number of Countries',
+            'year': 'Year',
+            'indicator_full_name': 'Indicator'
+        }
+    )
+    year_fig.update_layout(height=400)
+    
+    scatter_fig = create_coverage_births_scatter(_df, "Coverage vs Births by Indicator")
+    
+    return {
+        'box': box_fig.to_dict(),
+        'year_distribution': year_fig.to_dict(),
+        'scatter': scatter_fig.to_dict()
+    }
+
+def create_anc4_sba_coverage_analysis(anc4_sba_df, df_key):
     """Create detailed analysis of ANC4 and SBA coverage estimates from 2018-2022."""
-    # Filter for ANC4 and SBA indicators
-    anc4_sba_df = df[df['indicator_full_name'].isin(['Antenatal Care (4+ visits)', 'Skilled Birth Attendance'])].copy()
+    # Figure dicts are cached between reruns and rebuilt by show_figure;
+    # expanders start collapsed so the first paint only shows the summary table
+    figures = build_anc4_sba_figures(anc4_sba_df, df_key)
     
     # Coverage Distribution by U5MR Status
-    with st.expander("Coverage Distribution by U5MR Status", expanded=True):
+    with st.expander("Coverage Distribution by U5MR Status", expanded=False):
             st.markdown("""
             **What this graph shows us:**
             This box plot reveals the distribution of coverage values for each indicator across countries classified by their U5MR status. 
@@ -391,24 +619,10 @@ def create_anc4_sba_coverage_analysis(df):
             the equity gaps and variability in service delivery.
             """)
             
-            fig = px.box(
-                anc4_sba_df,
-                x='indicator_full_name',
-                y='coverage_value',
-                color='u5mr_status',
-                title="Coverage Distribution by U5MR Status",
-                labels={
-                    'coverage_value': 'Coverage (%)',
-                    'indicator_full_name': 'Indicator',
-                    'u5mr_status': 'U5MR Status'
-                }
-            )
-            
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            show_figure(figures['box'])
     
     # Year Distribution of Estimates
-    with st.expander("Year Distribution of Estimates", expanded=True):
+    with st.expander("Year Distribution of Estimates", expanded=False):
             st.markdown("""
             **What this graph shows us:**
             This bar chart displays the number of countries reporting estimates for each indicator by year. 
@@ -417,26 +631,10 @@ def create_anc4_sba_coverage_analysis(df):
             for assessing the reliability and completeness of global health monitoring.
             """)
             
-            year_dist = anc4_sba_df.groupby(['year', 'indicator_full_name']).size().reset_index(name='count')
-            
-            fig = px.bar(
-                year_dist,
-                x='year',
-                y='count',
-                color='indicator_full_name',
-                title="Number of Countries with Estimates by Year",
-                labels={
-                    'count': 'Number of Countries',
-                    'year': 'Year',
-                    'indicator_full_name': 'Indicator'
-                }
-            )
-            
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            show_figure(figures['year_distribution'])
     
     # Coverage vs Births Relationship
-    with st.expander("Coverage vs Births Relationship", expanded=True):
+    with st.expander("Coverage vs Births Relationship", expanded=False):
             st.markdown("""
             **What this graph shows us:**
             This scatter plot examines the relationship between health service coverage and birth volume (2022 projected births). 
@@ -445,23 +643,7 @@ def create_anc4_sba_coverage_analysis(df):
             low coverage) represent the greatest policy concern as they have the highest burden of need.
             """)
             
-            fig = px.scatter(
-                anc4_sba_df,
-                x='births_2022',
-                y='coverage_value',
-                color='indicator_full_name',
-                size='coverage_value',
-                hover_data=['country_name', 'year', 'u5mr_status'],
-                title="Coverage vs Births by Indicator",
-                labels={
-                    'births_2022': 'Births (2022)',
-                    'coverage_value': 'Coverage (%)',
-                    'indicator_full_name': 'Indicator'
-                }
-            )
-            
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            show_figure(figures['scatter'])
 
 def create_methodology_section():
     """Create methodology and results discussion section."""
@@ -565,7 +747,7 @@ def main():
     create_header()
     
     # Load data
-    results, df = load_analysis_data()
+    results, df, precomputed = load_analysis_data()
     
     if results is None or df is None:
         st.error("❌ Unable to load analysis data. Please ensure the analysis has been run.")
@@ -600,7 +782,7 @@ def main():
             and Skilled Birth Attendance. This visualization highlights the critical relationship between health system 
             performance and child survival outcomes.
             """)
-            create_coverage_comparison_chart(results, "overview_coverage_comparison")
+            create_coverage_comparison_chart(precomputed['comparison_df'], "overview_coverage_comparison")
         else:
             # Display key metrics (default view)
             st.markdown("### Key Metrics Summary")
@@ -635,24 +817,11 @@ def main():
         # Coverage Summary Table at the beginning
         st.markdown("### Coverage Summary by Indicator")
         
-        # Filter for ANC4 and SBA indicators
-        anc4_sba_df = df[df['indicator_full_name'].isin(['Antenatal Care (4+ visits)', 'Skilled Birth Attendance'])].copy()
-        
-        # Create summary table
-        summary_data = []
-        for indicator in anc4_sba_df['indicator_full_name'].unique():
-            indicator_data = anc4_sba_df[anc4_sba_df['indicator_full_name'] == indicator]
-            summary_data.append({
-                'Indicator': indicator,
-                'Average Coverage (%)': f"{indicator_data['coverage_value'].mean():.1f}",
-                'Median Coverage (%)': f"{indicator_data['coverage_value'].median():.1f}",
-                'Countries with Data': indicator_data['country_name'].nunique(),
-                'Coverage Range (%)': f"{indicator_data['coverage_value'].min():.1f} - {indicator_data['coverage_value'].max():.1f}",
-                'On-track Average (%)': f"{indicator_data[indicator_data['u5mr_status'] == 'on_track']['coverage_value'].mean():.1f}",
-                'Off-track Average (%)': f"{indicator_data[indicator_data['u5mr_status'] == 'off_track']['coverage_value'].mean():.1f}"
-            })
-        
-        summary_df = pd.DataFrame(summary_data)
+        anc4_sba_df = precomputed['anc4_sba_df']
+        
+        # Create summary table (cached on a cheap fingerprint of the data)
+        df_key = (len(anc4_sba_df), float(anc4_sba_df['coverage_value'].sum()))
+        summary_df = compute_indicator_summary(anc4_sba_df, df_key)
         st.dataframe(summary_df, use_container_width=True)
         
         st.markdown("---")
@@ -667,16 +836,16 @@ def main():
             and Skilled Birth Attendance. This visualization highlights the critical relationship between health system 
             performance and child survival outcomes.
             """)
-            create_coverage_comparison_chart(results, "detailed_coverage_comparison")
+            create_coverage_comparison_chart(precomputed['comparison_df'], "detailed_coverage_comparison")
         
         # Other analysis charts
-        create_anc4_sba_coverage_analysis(df)
+        create_anc4_sba_coverage_analysis(anc4_sba_df, df_key)
     
     with tab3:
-        create_country_explorer(df)
+        create_country_explorer(df, precomputed)
     
     with tab4:
-        create_weighted_vs_simple_chart(results)
+        create_weighted_vs_simple_chart(precomputed['weighted_vs_simple_df'])
     
     with tab5:
         create_methodology_section()
@@ -12,12 +12,24 @@ This is the main entry point for the UNICEF technical evaluation.
 """
 
 import sys
+import json
+import logging
+import traceback
 from pathlib import Path
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import subprocess
+import socket
 import webbrowser
 import time
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add src to path
 sys.path.append('src')
 
@@ -55,8 +67,14 @@ def launch_streamlit_dashboard():
             '--server.port', '8501'
         ])
         
-        # Wait a moment for Streamlit to start
-        time.sleep(3)
+        # Wait until Streamlit is accepting connections (up to 15 seconds)
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline and process.poll() is None:
+            try:
+                with socket.create_connection(('localhost', 8501), timeout=0.2):
+                    break
+            except OSError:
+                time.sleep(0.1)
         
         # Open browser
         try:
@@ -84,6 +102,9 @@ def launch_streamlit_dashboard():
 
 def main():
     """Execute the complete UNICEF health services coverage analysis."""
+    # Show step progress logged by the analysis modules on the console
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     print("="*80)
     print("UNICEF HEALTH SERVICES COVERAGE ANALYSIS")
     print("Technical Evaluation for Data and Analytics Education Team")
@@ -109,7 +130,9 @@ def main():
     config = {
         'processing': {
             'min_year': 2018,
-            'max_year': 2022
+            'max_year': 2022,
+            # 'polars' runs the UNICEF cleaning as a lazy Polars query when installed
+            'engine': 'pandas'
         }
     }
     
@@ -140,7 +163,7 @@ def main():
         print("STEP 2: BIRTHS-WEIGHTED COVERAGE CALCULATION")
         print("="*80)
         
-        calculator = CoverageCalculator(merged_data)
+        calculator = CoverageCalculator(merged_data, verbose=True)
         results = calculator.get_results_for_reporting()
         
         print(f"\n✓ Coverage calculation completed successfully!")
@@ -154,11 +177,22 @@ def main():
         
         # Save merged data for dashboard
         print("\nSaving data for interactive dashboard...")
-        merged_data.to_csv(data_paths['output'] / 'final_merged_dataset.csv', index=False)
         
-        # Save results as JSON for dashboard
-        import json
+        # Multithreaded Arrow CSV writer, plus a Parquet copy for fast dashboard loads
+        merged_table = pa.Table.from_pandas(merged_data, preserve_index=False)
+        pa_csv.write_csv(merged_table, data_paths['output'] / 'final_merged_dataset.csv')
         
+        # Low-cardinality text columns are stored dictionary-encoded in the Parquet file
+        merged_data.astype({
+            'country_name': 'category',
+            'indicator': 'category',
+            'u5mr_status': 'category'
+        }).to_parquet(data_paths['output'] / 'final_merged_dataset.parquet', index=False, compression='snappy')
+        
+        # Pre-grouped births-weighted rollups so consumers filter instead of regrouping
+        calculator.get_aggregate_table().to_parquet(data_paths['output'] / 'aggregates.parquet', index=False, compression='snappy')
+        
+        # Save results as JSON for dashboard
         # Convert DataFrame to dict for JSON serialization
         results_for_json = results.copy()
         if 'data_for_visualization' in results_for_json:
@@ -166,8 +200,13 @@ def main():
             if isinstance(results_for_json['data_for_visualization'], pd.DataFrame):
                 results_for_json['data_for_visualization'] = results_for_json['data_for_visualization'].to_dict('records')
         
-        with open(data_paths['output'] / 'analysis_results.json', 'w') as f:
-            json.dump(results_for_json, f, indent=2)
+        if ORJSON_AVAILABLE:
+            # C encoder; numpy scalars from the pandas aggregates serialize natively
+            with open(data_paths['output'] / 'analysis_results.json', 'wb') as f:
+                f.write(orjson.dumps(results_for_json, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(data_paths['output'] / 'analysis_results.json', 'w') as f:
+                json.dump(results_for_json, f, indent=2, default=lambda value: value.item())
         
         print("✓ Data exported successfully for Streamlit dashboard")
         
@@ -179,6 +218,8 @@ def main():
         print(f"\nOUTPUT FILES:")
         print(f"  • Analysis Results: data/output/analysis_results.json")
         print(f"  • Merged Dataset: data/output/final_merged_dataset.csv")
+        print(f"  • Merged Dataset (Parquet): data/output/final_merged_dataset.parquet")
+        print(f"  • Aggregate Tables: data/output/aggregates.parquet")
         print(f"  • Interactive Dashboard: app.py")
         
         print(f"\nKEY RESULTS:")
@@ -231,7 +272,6 @@ def main():
         
     except Exception as e:
         print(f"\n❌ ERROR: Analysis failed - {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Aggregation Kernels for Coverage Calculation
+============================================
+
+Segmented aggregation of coverage values keyed by small integer
+(indicator, status) codes, used by the coverage calculator, and the
+year/value row filter used by the data cleaner.
+
+The kernels are compiled with numba when it is installed; otherwise a NumPy
+implementation with identical outputs is used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def weighted_agg(val, w, ind, status, n_ind, n_status):
+        """Per (indicator, status) cell: sums of w*val, w and val, row count, min and max of val."""
+        sum_wx = np.zeros((n_ind, n_status))
+        sum_w = np.zeros((n_ind, n_status))
+        sum_x = np.zeros((n_ind, n_status))
+        count = np.zeros((n_ind, n_status), dtype=np.int64)
+        min_x = np.full((n_ind, n_status), np.inf)
+        max_x = np.full((n_ind, n_status), -np.inf)
+        for k in range(val.size):
+            i = ind[k]
+            j = status[k]
+            sum_wx[i, j] += w[k] * val[k]
+            sum_w[i, j] += w[k]
+            sum_x[i, j] += val[k]
+            count[i, j] += 1
+            if val[k] < min_x[i, j]:
+                min_x[i, j] = val[k]
+            if val[k] > max_x[i, j]:
+                max_x[i, j] = val[k]
+        return sum_wx, sum_w, sum_x, count, min_x, max_x
+else:
+    def weighted_agg(val, w, ind, status, n_ind, n_status):
+        """Per (indicator, status) cell: sums of w*val, w and val, row count, min and max of val."""
+        shape = (n_ind, n_status)
+        n_cells = n_ind * n_status
+        cell = ind * n_status + status
+        
+        sum_wx = np.bincount(cell, weights=w * val, minlength=n_cells).reshape(shape)
+        sum_w = np.bincount(cell, weights=w, minlength=n_cells).reshape(shape)
+        sum_x = np.bincount(cell, weights=val, minlength=n_cells).reshape(shape)
+        count = np.bincount(cell, minlength=n_cells).reshape(shape)
+        
+        min_x = np.full(n_cells, np.inf)
+        max_x = np.full(n_cells, -np.inf)
+        np.minimum.at(min_x, cell, val)
+        np.maximum.at(max_x, cell, val)
+        
+        return sum_wx, sum_w, sum_x, count, min_x.reshape(shape), max_x.reshape(shape)
+
+
+def _range_mask_numpy(year, val, year_min, year_max, val_min, val_max):
+    """NumPy implementation of range_mask."""
+    in_years = (year >= year_min) & (year <= year_max)
+    # NaN fails both comparisons
+    keep = in_years & (val >= val_min) & (val <= val_max)
+    return in_years, keep
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _range_mask_numba(year, val, year_min, year_max, val_min, val_max):
+        """Numba implementation of range_mask."""
+        in_years = np.empty(year.size, dtype=np.bool_)
+        keep = np.empty(year.size, dtype=np.bool_)
+        for k in range(year.size):
+            in_years[k] = year[k] >= year_min and year[k] <= year_max
+            # NaN fails both comparisons
+            keep[k] = in_years[k] and val[k] >= val_min and val[k] <= val_max
+        return in_years, keep
+
+
+# The first numba call in a process spends ~150 ms loading the cached kernel, which it
+# only wins back (at ~1 ns per row over NumPy) on inputs of this size
+RANGE_MASK_NUMBA_MIN_ROWS = 100_000_000
+
+
+def range_mask(year, val, year_min, year_max, val_min, val_max):
+    """Rows within the year bounds, and rows also holding a non-NaN value within the value bounds."""
+    if NUMBA_AVAILABLE and year.size >= RANGE_MASK_NUMBA_MIN_ROWS:
+        return _range_mask_numba(year, val, year_min, year_max, val_min, val_max)
+    return _range_mask_numpy(year, val, year_min, year_max, val_min, val_max)
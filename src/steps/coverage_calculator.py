@@ -20,216 +20,286 @@ import numpy as np
 from typing import Dict, Any, Tuple
 import logging
 
+from ._kernels import weighted_agg
+
 
 class CoverageCalculator:
     """Calculates population-weighted coverage for health services."""
     
-    def __init__(self, merged_data: pd.DataFrame):
-        """Initialize with merged dataset."""
+    def __init__(self, merged_data: pd.DataFrame, verbose: bool = False):
+        """Initialize with merged dataset; set verbose to log the calculation steps."""
         self.data = merged_data
+        self.verbose = verbose
         self.logger = logging.getLogger(__name__)
         
+        # Filtered data, known-status partials and results, memoized by calculate_population_weighted_coverage
+        self._valid = None
+        self._status_partials = None
+        self._results = None
+        
         # Validate required columns
         required_cols = ['country_name', 'indicator', 'year', 'coverage_value', 'births_2022', 'u5mr_status']
         missing_cols = [col for col in required_cols if col not in self.data.columns]
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
+        
+        # Low-cardinality keys as categoricals so grouping and filtering work on integer codes
+        self.data = self.data.astype({
+            'indicator': 'category',
+            'u5mr_status': 'category',
+            'country_name': 'category'
+        })
+        
+        # The cleaner stores the measures as float32; widen them through each value's shortest
+        # repr so exported statistics carry the source values (24.4, not 24.399999618530273)
+        for col in ['coverage_value', 'births_2022']:
+            if self.data[col].dtype == np.float32:
+                self.data[col] = self.data[col].astype(str).astype(np.float64)
+    
+    def _log(self, message: str) -> None:
+        """Log a progress message when running in verbose mode."""
+        if self.verbose:
+            self.logger.info(message)
     
     def calculate_population_weighted_coverage(self) -> Dict[str, Any]:
         """Calculate population-weighted coverage for ANC4 and SBA by U5MR status."""
-        print("="*80)
-        print("POPULATION-WEIGHTED COVERAGE CALCULATION")
-        print("="*80)
+        if self._results is not None:
+            return self._results
+        
+        self._log("="*80)
+        self._log("POPULATION-WEIGHTED COVERAGE CALCULATION")
+        self._log("="*80)
         
         results = {}
         
-                # Filter for valid data
-        valid_data = self.data[
-            (self.data['coverage_value'].notna()) &
-            (self.data['births_2022'].notna()) &
-            (self.data['coverage_value'] >= 0) &
-            (self.data['coverage_value'] <= 100) &
-            (self.data['births_2022'] > 0)
-        ].copy()
+        # Filter for valid data (comparisons against NaN are False, so missing values drop out)
+        valid_data = self.data.query('births_2022 > 0 and 0 <= coverage_value <= 100')
+        
+        self._log(f"Valid data records: {len(valid_data)}")
+        self._log(f"Unique countries: {valid_data['country_name'].nunique()}")
+        self._log(f"Year range: {valid_data['year'].min()} - {valid_data['year'].max()}")
+        
+        # Coverage partials per (indicator, status) in a single pass
+        partials = self._calculate_group_partials(valid_data)
+        totals = self._calculate_indicator_totals(partials)
         
-        print(f"Valid data records: {len(valid_data)}")
-        print(f"Unique countries: {valid_data['country_name'].nunique()}")
-        print(f"Year range: {valid_data['year'].min()} - {valid_data['year'].max()}")
+        # Missing and 'unknown' statuses count towards overall figures only, so drop them once here
+        status = partials.index.get_level_values('u5mr_status')
+        status_partials = partials[status.notna() & (status != 'unknown')]
         
         # Calculate overall population-weighted averages
-        results['overall'] = self._calculate_overall_coverage(valid_data)
+        results['overall'] = self._calculate_overall_coverage(totals)
         
         # Calculate by U5MR status
-        results['by_status'] = self._calculate_by_u5mr_status(valid_data)
+        results['by_status'] = self._calculate_by_u5mr_status(valid_data, status_partials)
         
         # Calculate by indicator
-        results['by_indicator'] = self._calculate_by_indicator(valid_data)
+        results['by_indicator'] = self._calculate_by_indicator(totals, status_partials)
         
         # Generate summary statistics
         results['summary'] = self._generate_summary_statistics(valid_data)
         
-        print("\n" + "="*80)
-        print("CALCULATION COMPLETED")
-        print("="*80)
+        self._log("\n" + "="*80)
+        self._log("CALCULATION COMPLETED")
+        self._log("="*80)
+        
+        self._valid = valid_data
+        self._status_partials = status_partials
+        self._results = results
         
         return results
     
-    def _calculate_overall_coverage(self, data: pd.DataFrame) -> Dict[str, float]:
+    @staticmethod
+    def _category_codes(column: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+        """Category codes as int64, with missing values mapped to a trailing slot."""
+        categories = column.cat.categories
+        codes = column.cat.codes.to_numpy().astype(np.int64)
+        codes[codes < 0] = len(categories)
+        return codes, categories
+    
+    def _calculate_group_partials(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Aggregate coverage per (indicator, status) cell in one pass over the rows.
+        
+        A single kernel pass yields the sums of coverage*births, births and
+        coverage, the row count and the coverage range of every cell; overall,
+        per-status and per-indicator figures are all derived from these
+        partials. Country counts can be summed across statuses because each
+        country carries a single U5MR status.
+        """
+        ind_codes, ind_labels = self._category_codes(data['indicator'])
+        status_codes, status_labels = self._category_codes(data['u5mr_status'])
+        n_ind, n_status = len(ind_labels) + 1, len(status_labels) + 1
+        
+        sum_wx, sum_w, sum_x, count, min_x, max_x = weighted_agg(
+            data['coverage_value'].to_numpy(dtype=np.float64),
+            data['births_2022'].to_numpy(dtype=np.float64),
+            ind_codes, status_codes, n_ind, n_status
+        )
+        
+        # Distinct countries per cell from the unique (cell, country) code pairs
+        country_codes = data['country_name'].cat.codes.to_numpy().astype(np.int64)
+        n_country = len(data['country_name'].cat.categories)
+        has_country = country_codes >= 0
+        cell = ind_codes * n_status + status_codes
+        pairs = np.unique(cell[has_country] * n_country + country_codes[has_country])
+        num_countries = np.bincount(pairs // n_country, minlength=n_ind * n_status)
+        
+        # The trailing slot of each key holds its missing values, labelled NaN
+        ind_slot, status_slot = np.divmod(np.arange(n_ind * n_status), n_status)
+        index = pd.MultiIndex(
+            levels=[ind_labels, status_labels],
+            codes=[
+                np.where(ind_slot < len(ind_labels), ind_slot, -1),
+                np.where(status_slot < len(status_labels), status_slot, -1)
+            ],
+            names=['indicator', 'u5mr_status']
+        )
+        
+        partials = pd.DataFrame({
+            '_wx': sum_wx.ravel(),
+            '_w': sum_w.ravel(),
+            '_x': sum_x.ravel(),
+            '_n': count.ravel(),
+            '_min': min_x.ravel(),
+            '_max': max_x.ravel(),
+            'num_countries': num_countries
+        }, index=index)
+        
+        return partials[partials['_n'] > 0]
+    
+    def _calculate_indicator_totals(self, partials: pd.DataFrame) -> pd.DataFrame:
+        """Combine the (indicator, status) partials across statuses."""
+        return partials.groupby(level='indicator', sort=False).agg(
+            _wx=('_wx', 'sum'),
+            _w=('_w', 'sum'),
+            _x=('_x', 'sum'),
+            _n=('_n', 'sum'),
+            _min=('_min', 'min'),
+            _max=('_max', 'max'),
+            num_countries=('num_countries', 'sum')
+        )
+    
+    def _calculate_overall_coverage(self, totals: pd.DataFrame) -> Dict[str, float]:
         """Calculate overall population-weighted coverage for each indicator."""
-        print("\n OVERALL POPULATION-WEIGHTED COVERAGE:")
-        print("-" * 50)
+        self._log("\n OVERALL POPULATION-WEIGHTED COVERAGE:")
+        self._log("-" * 50)
         
         overall_results = {}
         
-        for indicator in data['indicator'].unique():
-            indicator_data = data[data['indicator'] == indicator]
-            
-            # Calculate births-weighted average (using 2022 projected births as weights)
-            weighted_avg = np.average(
-                indicator_data['coverage_value'],
-                weights=indicator_data['births_2022']
-            )
-            
-            # Calculate simple average for comparison
-            simple_avg = indicator_data['coverage_value'].mean()
-            
-            # Calculate statistics
-            total_births = indicator_data['births_2022'].sum()
-            num_countries = indicator_data['country_name'].nunique()
+        for indicator, wx, w, x, n, min_coverage, max_coverage, num_countries in totals.itertuples(name=None):
+            # Births-weighted average (using 2022 projected births as weights)
+            weighted_avg = wx / w
+            simple_avg = x / n
             
             overall_results[indicator] = {
                 'births_weighted_avg': weighted_avg,
                 'simple_avg': simple_avg,
-                'total_births': total_births,
-                'num_countries': num_countries,
-                'min_coverage': indicator_data['coverage_value'].min(),
-                'max_coverage': indicator_data['coverage_value'].max()
+                'total_births': w,
+                'num_countries': int(num_countries),
+                'min_coverage': min_coverage,
+                'max_coverage': max_coverage
             }
             
-            print(f"  {indicator}:")
-            print(f"    Births-weighted average: {weighted_avg:.2f}%")
-            print(f"    Simple average: {simple_avg:.2f}%")
-            print(f"    Total births (2022): {total_births:,.0f}")
-            print(f"    Number of countries: {num_countries}")
-            print(f"    Coverage range: {indicator_data['coverage_value'].min():.1f}% - {indicator_data['coverage_value'].max():.1f}%")
+            self._log(f"  {indicator}:")
+            self._log(f"    Births-weighted average: {weighted_avg:.2f}%")
+            self._log(f"    Simple average: {simple_avg:.2f}%")
+            self._log(f"    Total births (2022): {w:,.0f}")
+            self._log(f"    Number of countries: {num_countries}")
+            self._log(f"    Coverage range: {min_coverage:.1f}% - {max_coverage:.1f}%")
         
         return overall_results
     
-    def _calculate_by_u5mr_status(self, data: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    def _calculate_by_u5mr_status(self, data: pd.DataFrame, status_partials: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
         """Calculate population-weighted coverage by U5MR status (on-track vs off-track)."""
-        print("\n📊 COVERAGE BY U5MR STATUS:")
-        print("-" * 50)
+        self._log("\n📊 COVERAGE BY U5MR STATUS:")
+        self._log("-" * 50)
         
         status_results = {}
         
-        for status in data['u5mr_status'].unique():
-            if pd.isna(status) or status == 'unknown':
-                continue
-                
-            status_data = data[data['u5mr_status'] == status]
-            
-            print(f"\n  {status.upper().replace('_', ' ')} COUNTRIES:")
-            print(f"    Number of countries: {status_data['country_name'].nunique()}")
-            print(f"    Total births (2022): {status_data['births_2022'].sum():,.0f}")
+        # Per-status country counts span indicators, so they cannot be summed from the partials
+        status_countries = data.groupby('u5mr_status', sort=False, observed=True)['country_name'].nunique()
+        status_births = status_partials.groupby(level='u5mr_status', sort=False)['_w'].sum()
+        
+        for status in status_births.index:
+            self._log(f"\n  {status.upper().replace('_', ' ')} COUNTRIES:")
+            self._log(f"    Number of countries: {status_countries[status]}")
+            self._log(f"    Total births (2022): {status_births[status]:,.0f}")
             
             status_results[status] = {}
             
-            for indicator in status_data['indicator'].unique():
-                indicator_data = status_data[status_data['indicator'] == indicator]
-                
-                if len(indicator_data) == 0:
-                    continue
-                
-                # Calculate births-weighted average (using 2022 projected births as weights)
-                weighted_avg = np.average(
-                    indicator_data['coverage_value'],
-                    weights=indicator_data['births_2022']
-                )
-                
-                # Calculate simple average
-                simple_avg = indicator_data['coverage_value'].mean()
-                
-                # Calculate statistics
-                total_births = indicator_data['births_2022'].sum()
-                num_countries = indicator_data['country_name'].nunique()
+            rows = status_partials.xs(status, level='u5mr_status').itertuples(name=None)
+            for indicator, wx, w, x, n, min_coverage, max_coverage, num_countries in rows:
+                # Births-weighted average (using 2022 projected births as weights)
+                weighted_avg = wx / w
+                simple_avg = x / n
                 
                 status_results[status][indicator] = {
                     'births_weighted_avg': weighted_avg,
                     'simple_avg': simple_avg,
-                    'total_births': total_births,
-                    'num_countries': num_countries,
-                    'min_coverage': indicator_data['coverage_value'].min(),
-                    'max_coverage': indicator_data['coverage_value'].max()
+                    'total_births': w,
+                    'num_countries': int(num_countries),
+                    'min_coverage': min_coverage,
+                    'max_coverage': max_coverage
                 }
                 
-                print(f"      {indicator}:")
-                print(f"        Births-weighted average: {weighted_avg:.2f}%")
-                print(f"        Simple average: {simple_avg:.2f}%")
-                print(f"        Countries: {num_countries}")
-                print(f"        Coverage range: {indicator_data['coverage_value'].min():.1f}% - {indicator_data['coverage_value'].max():.1f}%")
+                self._log(f"      {indicator}:")
+                self._log(f"        Births-weighted average: {weighted_avg:.2f}%")
+                self._log(f"        Simple average: {simple_avg:.2f}%")
+                self._log(f"        Countries: {num_countries}")
+                self._log(f"        Coverage range: {min_coverage:.1f}% - {max_coverage:.1f}%")
         
         return status_results
     
-    def _calculate_by_indicator(self, data: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    def _calculate_by_indicator(self, totals: pd.DataFrame, status_partials: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
         """Calculate detailed statistics by indicator."""
-        print("\n📊 DETAILED INDICATOR ANALYSIS:")
-        print("-" * 50)
+        self._log("\n📊 DETAILED INDICATOR ANALYSIS:")
+        self._log("-" * 50)
         
         indicator_results = {}
         
-        for indicator in data['indicator'].unique():
-            indicator_data = data[data['indicator'] == indicator]
-            
-            print(f"\n  {indicator}:")
+        status_indicators = status_partials.index.get_level_values('indicator')
+        
+        for indicator in totals.index:
+            self._log(f"\n  {indicator}:")
             
             # Overall statistics
-            overall_weighted = np.average(
-                indicator_data['coverage_value'],
-                weights=indicator_data['births_2022']
-            )
-            overall_simple = indicator_data['coverage_value'].mean()
+            overall_weighted = totals.at[indicator, '_wx'] / totals.at[indicator, '_w']
+            overall_simple = totals.at[indicator, '_x'] / totals.at[indicator, '_n']
             
-            print(f"    Overall births-weighted average: {overall_weighted:.2f}%")
-            print(f"    Overall simple average: {overall_simple:.2f}%")
+            self._log(f"    Overall births-weighted average: {overall_weighted:.2f}%")
+            self._log(f"    Overall simple average: {overall_simple:.2f}%")
             
             # By U5MR status
             status_comparison = {}
-            for status in indicator_data['u5mr_status'].unique():
-                if pd.isna(status) or status == 'unknown':
-                    continue
-                    
-                status_data = indicator_data[indicator_data['u5mr_status'] == status]
+            # Boolean slice rather than xs: an indicator may have no known-status rows
+            indicator_partials = status_partials[status_indicators == indicator].droplevel('indicator')
+            for status, wx, w, x, n, _, _, num_countries in indicator_partials.itertuples(name=None):
+                status_weighted = wx / w
+                status_simple = x / n
                 
-                if len(status_data) > 0:
-                    status_weighted = np.average(
-                        status_data['coverage_value'],
-                        weights=status_data['births_2022']
-                    )
-                    status_simple = status_data['coverage_value'].mean()
-                    
-                    status_comparison[status] = {
-                        'births_weighted_avg': status_weighted,
-                        'simple_avg': status_simple,
-                        'num_countries': status_data['country_name'].nunique(),
-                        'total_births': status_data['births_2022'].sum()
-                    }
-                    
-                    print(f"      {status.replace('_', ' ').title()}: {status_weighted:.2f}% (weighted), {status_simple:.2f}% (simple)")
+                status_comparison[status] = {
+                    'births_weighted_avg': status_weighted,
+                    'simple_avg': status_simple,
+                    'num_countries': int(num_countries),
+                    'total_births': w
+                }
+                
+                self._log(f"      {status.replace('_', ' ').title()}: {status_weighted:.2f}% (weighted), {status_simple:.2f}% (simple)")
             
             indicator_results[indicator] = {
                 'overall_weighted': overall_weighted,
                 'overall_simple': overall_simple,
                 'status_comparison': status_comparison,
-                'total_countries': indicator_data['country_name'].nunique(),
-                'total_births': indicator_data['births_2022'].sum()
+                'total_countries': int(totals.at[indicator, 'num_countries']),
+                'total_births': totals.at[indicator, '_w']
             }
         
         return indicator_results
     
     def _generate_summary_statistics(self, data: pd.DataFrame) -> Dict[str, Any]:
         """Generate comprehensive summary statistics."""
-        print("\n📊 SUMMARY STATISTICS:")
-        print("-" * 50)
+        self._log("\n📊 SUMMARY STATISTICS:")
+        self._log("-" * 50)
         
         summary = {
             'total_records': len(data),
@@ -250,16 +320,16 @@ class CoverageCalculator:
             }
         }
         
-        print(f"  Total records: {summary['total_records']:,}")
-        print(f"  Unique countries: {summary['unique_countries']}")
-        print(f"  Year range: {summary['year_range']['min']} - {summary['year_range']['max']}")
-        print(f"  Indicators: {summary['indicators']}")
-        print(f"  Total births (2022): {summary['total_births']:,.0f}")
-        print(f"  Coverage statistics:")
-        print(f"    Mean: {summary['coverage_statistics']['mean']:.2f}%")
-        print(f"    Median: {summary['coverage_statistics']['median']:.2f}%")
-        print(f"    Standard deviation: {summary['coverage_statistics']['std']:.2f}%")
-        print(f"    Range: {summary['coverage_statistics']['min']:.1f}% - {summary['coverage_statistics']['max']:.1f}%")
+        self._log(f"  Total records: {summary['total_records']:,}")
+        self._log(f"  Unique countries: {summary['unique_countries']}")
+        self._log(f"  Year range: {summary['year_range']['min']} - {summary['year_range']['max']}")
+        self._log(f"  Indicators: {summary['indicators']}")
+        self._log(f"  Total births (2022): {summary['total_births']:,.0f}")
+        self._log(f"  Coverage statistics:")
+        self._log(f"    Mean: {summary['coverage_statistics']['mean']:.2f}%")
+        self._log(f"    Median: {summary['coverage_statistics']['median']:.2f}%")
+        self._log(f"    Standard deviation: {summary['coverage_statistics']['std']:.2f}%")
+        self._log(f"    Range: {summary['coverage_statistics']['min']:.1f}% - {summary['coverage_statistics']['max']:.1f}%")
         
         return summary
     
@@ -277,33 +347,35 @@ class CoverageCalculator:
         
         return reporting_data
     
+    def get_aggregate_table(self) -> pd.DataFrame:
+        """Births-weighted coverage per (indicator, status, year, country) for export."""
+        self.calculate_population_weighted_coverage()
+        
+        w = self._valid['births_2022'].to_numpy(dtype=np.float64)
+        wx = self._valid['coverage_value'].to_numpy(dtype=np.float64) * w
+        
+        agg = self._valid.assign(_wx=wx, _w=w).groupby(
+            ['indicator', 'u5mr_status', 'year', 'country_name'], observed=True
+        ).agg(
+            _wx=('_wx', 'sum'),
+            _w=('_w', 'sum')
+        )
+        agg['coverage'] = agg['_wx'] / agg['_w']
+        
+        return agg.rename(columns={'_w': 'births'}).drop(columns='_wx').reset_index()
+    
     def _prepare_data_for_visualization(self) -> pd.DataFrame:
         """Prepare data specifically for visualization."""
-        # Create a summary dataframe for plotting
-        viz_data = []
-        
-        for indicator in self.data['indicator'].unique():
-            for status in self.data['u5mr_status'].unique():
-                if pd.isna(status) or status == 'unknown':
-                    continue
-                    
-                subset = self.data[
-                    (self.data['indicator'] == indicator) &
-                    (self.data['u5mr_status'] == status)
-                ]
-                
-                if len(subset) > 0:
-                                    weighted_avg = np.average(
-                    subset['coverage_value'],
-                    weights=subset['births_2022']
-                )
-                
-                viz_data.append({
-                    'indicator': indicator,
-                    'u5mr_status': status,
-                    'coverage_value': weighted_avg,
-                    'num_countries': subset['country_name'].nunique(),
-                    'total_births': subset['births_2022'].sum()
-                })
-        
-        return pd.DataFrame(viz_data) 
\ No newline at end of file
+        self.calculate_population_weighted_coverage()
+        
+        # Births-weighted averages per (indicator, status) from the weighted-sum partials
+        partials = self._status_partials.reset_index()
+        
+        # Built column-wise with explicit dtypes, so no per-row inference pass
+        return pd.DataFrame({
+            'indicator': partials['indicator'].astype('category'),
+            'u5mr_status': partials['u5mr_status'].astype('category'),
+            'coverage_value': (partials['_wx'] / partials['_w']).astype('float64'),
+            'num_countries': partials['num_countries'].astype('int32'),
+            'total_births': partials['_w'].astype('float64')
+        }).reset_index(drop=True)
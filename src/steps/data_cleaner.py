@@ -19,10 +19,36 @@ Key Functions:
 
 import pandas as pd
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, List
 import numpy as np
 
+from ._kernels import range_mask
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+
+# Columns and dtypes read from the UNICEF indicators CSV
+UNICEF_DTYPES = {
+    'REF_AREA:Geographic area': 'string[pyarrow]',
+    'INDICATOR:Indicator': 'string[pyarrow]',
+    'TIME_PERIOD:Time period': 'int16',
+    'OBS_VALUE:Observation Value': 'float32'
+}
+
+# Raw datasets by cache name; each has a DataCleaner._load_<name>_data loader
+RAW_DATASETS = ('unicef', 'population', 'u5mr')
+
+
+def _load_raw(name: str, config: Dict[str, Any], data_paths: Dict[str, Path]) -> pd.DataFrame:
+    """Load one raw dataset in a worker process (module-level so it can be pickled)."""
+    return getattr(DataCleaner(config, data_paths), f'_load_{name}_data')()
+
 
 class DataCleaner:
     """Handles data cleaning and structuring """
@@ -36,6 +62,15 @@ class DataCleaner:
         # Get processing parameters from config
         self.min_year = config.get('processing', {}).get('min_year', 2018)
         self.max_year = config.get('processing', {}).get('max_year', 2022)
+        
+        # Engine for the UNICEF CSV stage: 'pandas' (default) or 'polars' when installed
+        self.engine = config.get('processing', {}).get('engine', 'pandas')
+        if self.engine == 'polars' and not POLARS_AVAILABLE:
+            self.logger.warning("Polars is not installed; using the pandas engine")
+            self.engine = 'pandas'
+        
+        # Raw frames by dataset name, so structure analysis and cleaning parse each file once
+        self._raw_cache = {}
     
     def analyze_data_structure(self) -> Dict[str, Any]:
         """Step 1: Analyze data structure and identify cleaning needs."""
@@ -47,14 +82,63 @@ class DataCleaner:
         
         try:
             # Load raw data
+            self._load_raw_datasets()
             unicef_raw = self._load_unicef_data()
             population_raw = self._load_population_data()
             u5mr_raw = self._load_u5mr_data()
             
             # Analyze each dataset
-            analysis['unicef'] = self._analyze_unicef_structure(unicef_raw)
-            analysis['population'] = self._analyze_population_structure(population_raw)
-            analysis['u5mr'] = self._analyze_u5mr_structure(u5mr_raw)
+            analysis['unicef'] = self._analyze_generic(
+                unicef_raw, 'UNICEF',
+                key_columns={
+                    'country': 'REF_AREA:Geographic area',
+                    'indicator': 'INDICATOR:Indicator',
+                    'year': 'TIME_PERIOD:Time period',
+                    'value': 'OBS_VALUE:Observation Value'
+                },
+                cleaning_needs=[
+                    "Extract country names from 'CODE: Country Name' format",
+                    "Extract indicator names from 'INDICATOR: Indicator Name' format",
+                    "Filter for years 2018-2022",
+                    "Convert values to numeric",
+                    "Filter valid percentage values (0-100)",
+                    "Handle missing values"
+                ]
+            )
+            
+            analysis['population'] = self._analyze_generic(
+                population_raw, 'Population',
+                key_columns=population_raw.attrs.get('key_columns', {}),
+                cleaning_needs=[
+                    "Filter for years 2018-2022",
+                    "Extract country names and ISO codes",
+                    "Convert population to numeric",
+                    "Handle missing values",
+                    "Standardize country identifiers"
+                ]
+            )
+            print(f"\nIdentified key columns: {analysis['population']['key_columns']}")
+            
+            analysis['u5mr'] = self._analyze_generic(
+                u5mr_raw, 'U5MR',
+                key_columns={
+                    'iso3': 'ISO3Code',
+                    'country': 'OfficialName',
+                    'status': 'Status.U5MR'
+                },
+                cleaning_needs=[
+                    "Standardize country names",
+                    "Create binary on-track/off-track classification",
+                    "Handle missing values",
+                    "Ensure consistent ISO3 codes"
+                ],
+                sample_rows=5
+            )
+            
+            # Show unique status values
+            unique_status = u5mr_raw['Status.U5MR'].unique().tolist()
+            analysis['u5mr']['unique_status'] = unique_status
+            print(f"\nUnique U5MR status values: {unique_status}")
             
             # Print summary
             self._print_analysis_summary(analysis)
@@ -65,123 +149,31 @@ class DataCleaner:
             self.logger.error(f"Error in data structure analysis: {e}")
             raise
     
-    def _analyze_unicef_structure(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze UNICEF data structure."""
-        print("\n📊 UNICEF DATA STRUCTURE:")
-        print("-" * 50)
-        print(f"Shape: {df.shape}")
-        print(f"Columns: {list(df.columns)}")
-        print(f"Data types: {df.dtypes.to_dict()}")
-        print(f"Missing values: {df.isnull().sum().to_dict()}")
-        
-        # Sample data
-        print("\nSample data (first 2 rows):")
-        print(df.head(2).to_string())
-        
-        # Identify key columns
-        key_columns = {
-            'country': 'REF_AREA:Geographic area',
-            'indicator': 'INDICATOR:Indicator',
-            'year': 'TIME_PERIOD:Time period',
-            'value': 'OBS_VALUE:Observation Value'
-        }
-        
-        # Identify cleaning needs
-        cleaning_needs = [
-            "Extract country names from 'CODE: Country Name' format",
-            "Extract indicator names from 'INDICATOR: Indicator Name' format",
-            "Filter for years 2018-2022",
-            "Convert values to numeric",
-            "Filter valid percentage values (0-100)",
-            "Handle missing values"
-        ]
-        
-        return {
-            'shape': df.shape,
-            'columns': list(df.columns),
-            'dtypes': df.dtypes.to_dict(),
-            'missing_values': df.isnull().sum().to_dict(),
-            'key_columns': key_columns,
-            'cleaning_needs': cleaning_needs,
-            'sample_data': df.head(2).to_dict('records')
-        }
-    
-    def _analyze_population_structure(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze population data structure."""
-        print("\n📊 POPULATION DATA STRUCTURE:")
-        print("-" * 50)
-        print(f"Shape: {df.shape}")
-        print(f"Columns: {list(df.columns)}")
-        print(f"Data types: {df.dtypes.to_dict()}")
-        print(f"Missing values: {df.isnull().sum().to_dict()}")
-        
-        # Sample data
-        print("\nSample data (first 2 rows):")
-        print(df.head(2).to_string())
-        
-        # Get key columns from attributes
-        key_columns = df.attrs.get('key_columns', {})
-        print(f"\nIdentified key columns: {key_columns}")
-        
-        # Identify cleaning needs
-        cleaning_needs = [
-            "Filter for years 2018-2022",
-            "Extract country names and ISO codes",
-            "Convert population to numeric",
-            "Handle missing values",
-            "Standardize country identifiers"
-        ]
-        
-        return {
-            'shape': df.shape,
-            'columns': list(df.columns),
-            'dtypes': df.dtypes.to_dict(),
-            'missing_values': df.isnull().sum().to_dict(),
-            'key_columns': key_columns,
-            'cleaning_needs': cleaning_needs,
-            'sample_data': df.head(2).to_dict('records')
-        }
-    
-    def _analyze_u5mr_structure(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze U5MR data structure."""
-        print("\n📊 U5MR DATA STRUCTURE:")
+    def _analyze_generic(self, df: pd.DataFrame, name: str, key_columns: Dict[str, str],
+                         cleaning_needs: List[str], sample_rows: int = 2) -> Dict[str, Any]:
+        """Analyze the structure of one raw dataset, scanning it once."""
+        dtypes = dict(zip(df.columns, df.dtypes.astype(str)))
+        missing_values = df.isna().sum().to_dict()
+        sample = df.head(sample_rows)
+        
+        print(f"\n📊 {name.upper()} DATA STRUCTURE:")
         print("-" * 50)
         print(f"Shape: {df.shape}")
         print(f"Columns: {list(df.columns)}")
-        print(f"Data types: {df.dtypes.to_dict()}")
-        print(f"Missing values: {df.isnull().sum().to_dict()}")
+        print(f"Data types: {dtypes}")
+        print(f"Missing values: {missing_values}")
         
         # Sample data
-        print("\nSample data (first 5 rows):")
-        print(df.head(5).to_string())
-        
-        # Identify key columns
-        key_columns = {
-            'iso3': 'ISO3Code',
-            'country': 'OfficialName',
-            'status': 'Status.U5MR'
-        }
-        
-        # Show unique status values
-        print(f"\nUnique U5MR status values: {df['Status.U5MR'].unique().tolist()}")
-        
-        # Identify cleaning needs
-        cleaning_needs = [
-            "Standardize country names",
-            "Create binary on-track/off-track classification",
-            "Handle missing values",
-            "Ensure consistent ISO3 codes"
-        ]
+        print(f"\nSample data (first {sample_rows} rows):")
+        print(sample.to_string())
         
         return {
             'shape': df.shape,
             'columns': list(df.columns),
-            'dtypes': df.dtypes.to_dict(),
-            'missing_values': df.isnull().sum().to_dict(),
+            'dtypes': dtypes,
+            'missing_values': missing_values,
             'key_columns': key_columns,
-            'cleaning_needs': cleaning_needs,
-            'unique_status': df['Status.U5MR'].unique().tolist(),
-            'sample_data': df.head(5).to_dict('records')
+            'cleaning_needs': cleaning_needs
         }
     
     def _print_analysis_summary(self, analysis: Dict[str, Any]):
@@ -203,13 +195,16 @@ class DataCleaner:
         
         try:
             # Load raw data
-            unicef_raw = self._load_unicef_data()
+            self._load_raw_datasets()
             population_raw = self._load_population_data()
             u5mr_raw = self._load_u5mr_data()
             
             # Clean each dataset
             print("\n🧹 CLEANING UNICEF DATA...")
-            unicef_clean = self.clean_unicef_data(unicef_raw)
+            if self.engine == 'polars':
+                unicef_clean = self._clean_unicef_pl()
+            else:
+                unicef_clean = self.clean_unicef_data(self._load_unicef_data())
             
             print("\n🧹 CLEANING POPULATION DATA...")
             population_clean = self.clean_population_data(population_raw)
@@ -265,18 +260,42 @@ class DataCleaner:
         print(f"  Sample data:")
         print(df.head(3).to_string())
     
+    def _load_raw_datasets(self):
+        """Parse the raw files not yet cached in parallel worker processes."""
+        names = [name for name in RAW_DATASETS if name not in self._raw_cache]
+        if len(names) < 2:
+            return
+        
+        # The population workbook dominates the load; the CSV and U5MR sheet parse alongside it
+        with ProcessPoolExecutor(max_workers=len(names)) as executor:
+            futures = {name: executor.submit(_load_raw, name, self.config, self.data_paths) for name in names}
+            for name, future in futures.items():
+                self._raw_cache[name] = future.result()
+    
     def _load_unicef_data(self) -> pd.DataFrame:
         """Load UNICEF data from CSV file."""
+        if 'unicef' in self._raw_cache:
+            return self._raw_cache['unicef']
+        
         file_path = self.data_paths['raw'] / "fusion_GLOBAL_DATAFLOW_UNICEF_1.0_.MNCH_ANC4+MNCH_SAB..csv"
         if not file_path.exists():
             raise FileNotFoundError(f"UNICEF data file not found: {file_path}")
         
-        df = pd.read_csv(file_path)
+        # Only the four columns the cleaner uses, with dtypes fixed at parse time
+        df = pd.read_csv(
+            file_path,
+            usecols=list(UNICEF_DTYPES),
+            dtype=UNICEF_DTYPES
+        )
         self.logger.info(f"✓ UNICEF data loaded: {len(df)} records")
+        self._raw_cache['unicef'] = df
         return df
     
     def _load_population_data(self) -> pd.DataFrame:
         """Load population data from highly formatted Excel file."""
+        if 'population' in self._raw_cache:
+            return self._raw_cache['population']
+        
         file_path = self.data_paths['raw'] / "WPP2022_GEN_F01_DEMOGRAPHIC_INDICATORS_COMPACT_REV1.xlsx"
         if not file_path.exists():
             raise FileNotFoundError(f"Population data file not found: {file_path}")
@@ -291,134 +310,140 @@ class DataCleaner:
         df_raw = pd.read_excel(file_path, header=None)
         
         # Find the row with actual column headers (around row 17)
-        # Look for the row that contains "Region, subregion, country or area"
+        # Look for the row that contains "Region, subregion, country or area",
+        # which sits in one of the leading columns (column 2 in WPP 2022)
         header_row = None
-        for i in range(15, 20):  # Check rows 15-19
-            if i < len(df_raw):
-                row_values = df_raw.iloc[i].astype(str)
-                if any('region, subregion, country or area' in str(val).lower() for val in row_values):
-                    header_row = i
-                    break
+        for i in range(15, min(20, len(df_raw))):  # Check rows 15-19
+            if any('region, subregion, country or area' in str(val).lower() for val in df_raw.iloc[i, :4]):
+                header_row = i
+                break
         
         if header_row is None:
             # Fallback: use row 16 as header
             header_row = 16
         
-        # Read the Excel file with the correct header row
-        df = pd.read_excel(file_path, header=header_row)
-        
-
+        # Take headers and data from the rows already parsed rather than reading the workbook again
+        headers = df_raw.iloc[header_row]
+        df = df_raw.iloc[header_row + 1:].reset_index(drop=True)
+        df.columns = [header if pd.notna(header) else f'Unnamed: {i}' for i, header in enumerate(headers)]
+        df = df.infer_objects()
         
         # Store key column mapping for later use
-        key_columns = {}
-        for col in df.columns:
-            col_str = str(col).lower().strip()
-            if 'region, subregion, country or area' in col_str:
-                key_columns['country'] = col
-            elif 'iso3 alpha-code' in col_str:
-                key_columns['iso3'] = col
-            elif col_str == 'year':  # Exact match for 'Year'
-                key_columns['year'] = col
-            elif 'births' in col_str and 'thousands' in col_str:
-                key_columns['births_2022'] = col  # Use births as weights for 2022
-            elif 'total population, as of 1 july (thousands)' in col_str:
-                key_columns['population'] = col  # Keep for reference
+        key_columns = self._identify_pop_key_columns(df.columns)
+        
+        # Arrow-backed strings for the name and code columns the cleaner strips and merges on
+        df = df.astype({key_columns[role]: 'string[pyarrow]' for role in ('country', 'iso3') if role in key_columns})
+        
+        print(f"    Identified key columns: {key_columns}")
+        
+        df.attrs['key_columns'] = key_columns
+        self.logger.info(f"✓ Population data loaded: {len(df)} records")
+        self._raw_cache['population'] = df
+        return df
+    
+    @staticmethod
+    def _identify_pop_key_columns(columns) -> Dict[str, Any]:
+        """Map population key roles to column labels; the last matching column wins."""
+        # Lowercase each label once, in reverse so the first hit is the last match
+        lowered = [(str(col).lower().strip(), col) for col in reversed(list(columns))]
+        
+        def last_match(predicate):
+            return next((col for name, col in lowered if predicate(name)), None)
+        
+        key_columns = {
+            'country': last_match(lambda name: 'region, subregion, country or area' in name),
+            'iso3': last_match(lambda name: 'iso3 alpha-code' in name),
+            'year': last_match(lambda name: name == 'year'),  # Exact match for 'Year'
+            'births_2022': last_match(lambda name: 'births' in name and 'thousands' in name),  # Use births as weights for 2022
+            'population': last_match(lambda name: 'total population, as of 1 july (thousands)' in name)  # Keep for reference
+        }
+        key_columns = {role: col for role, col in key_columns.items() if col is not None}
         
         # Handle the specific case where 'Year ' (with trailing space) exists
-        if 'Year ' in df.columns:
+        if 'Year ' in columns:
             key_columns['year'] = 'Year '
         
         # If we couldn't identify columns automatically, use fallback positions
         if not key_columns:
             print("    Warning: Could not identify columns automatically, using fallback positions")
-            if len(df.columns) >= 12:
+            if len(columns) >= 12:
                 key_columns = {
-                    'country': df.columns[2],  # Usually country name
-                    'year': df.columns[10],    # Usually year
-                    'births_2022': df.columns[11]  # Use births as weights
+                    'country': columns[2],  # Usually country name
+                    'iso3': columns[5],     # Usually ISO3 alpha-code
+                    'year': columns[10],    # Usually year
+                    'births_2022': columns[11]  # Use births as weights
                 }
         
-        print(f"    Identified key columns: {key_columns}")
-        
-        df.attrs['key_columns'] = key_columns
-        self.logger.info(f"✓ Population data loaded: {len(df)} records")
-        return df
+        return key_columns
     
     def _load_u5mr_data(self) -> pd.DataFrame:
         """Load U5MR classification data from Excel file."""
+        if 'u5mr' in self._raw_cache:
+            return self._raw_cache['u5mr']
+        
         file_path = self.data_paths['raw'] / "On-track and off-track countries.xlsx"
         if not file_path.exists():
             raise FileNotFoundError(f"U5MR data file not found: {file_path}")
         
-        df = pd.read_excel(file_path)
+        # Arrow-backed strings for the name, code and status text
+        df = pd.read_excel(file_path, dtype='string[pyarrow]')
         self.logger.info(f"✓ U5MR data loaded: {len(df)} records")
+        self._raw_cache['u5mr'] = df
         return df
     
     def clean_unicef_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean UNICEF indicators data with unified column names for merging."""
         print("  Processing UNICEF data...")
         
-        # Create a copy to avoid modifying original
-        clean_df = df.copy()
-        
-        # Filter for relevant years (2018-2022)
-        clean_df = clean_df[
-            (clean_df['TIME_PERIOD:Time period'] >= self.min_year) &
-            (clean_df['TIME_PERIOD:Time period'] <= self.max_year)
-        ]
-        print(f"    Filtered to {len(clean_df)} records for years {self.min_year}-{self.max_year}")
-        
-        # Clean country names - extract actual country names from the format "CODE: Country Name"
-        clean_df['country_name'] = clean_df['REF_AREA:Geographic area'].str.extract(r':\s*(.+)')
-        clean_df['country_code'] = clean_df['REF_AREA:Geographic area'].str.extract(r'^([^:]+):')
+        # Year (2018-2022) and percentage (0-100) bounds in one pass over the raw arrays
+        in_years, keep = range_mask(
+            df['TIME_PERIOD:Time period'].to_numpy(),
+            df['OBS_VALUE:Observation Value'].to_numpy(),
+            self.min_year, self.max_year, 0.0, 100.0
+        )
+        print(f"    Filtered to {int(in_years.sum())} records for years {self.min_year}-{self.max_year}")
         
-        # Handle cases where extraction didn't work
-        clean_df['country_name'] = clean_df['country_name'].fillna(clean_df['REF_AREA:Geographic area'])
-        clean_df['country_code'] = clean_df['country_code'].fillna('UNKNOWN')
+        # Filter out invalid values (negative, > 100 or missing); rows are copied out only once
+        clean_df = df[keep]
+        print(f"    Filtered to {len(clean_df)} valid percentage records")
         
-        # Clean indicator names - extract the actual indicator name
-        clean_df['indicator_clean'] = clean_df['INDICATOR:Indicator'].str.extract(r'^([^:]+):')
-        clean_df['indicator_clean'] = clean_df['indicator_clean'].fillna(clean_df['INDICATOR:Indicator'])
+        # Clean country names - split "CODE: Country Name" once at the first colon
+        area_parts = clean_df['REF_AREA:Geographic area'].str.split(':', n=1, expand=True).reindex(columns=[0, 1])
         
-        # Convert value to numeric and handle missing values
-        clean_df['value_clean'] = pd.to_numeric(clean_df['OBS_VALUE:Observation Value'], errors='coerce')
-        
-        # Filter out invalid values (negative or > 100 for percentages)
-        clean_df = clean_df[
-            (clean_df['value_clean'] >= 0) & 
-            (clean_df['value_clean'] <= 100) &
-            (clean_df['value_clean'].notna())
-        ]
-        print(f"    Filtered to {len(clean_df)} valid percentage records")
+        # Handle cases without a colon: keep the full name and mark the code unknown
+        has_code = area_parts[1].notna()
         
         # Create unified column names for merging
-        result_df = clean_df[[
-            'country_name', 'country_code', 'indicator_clean', 
-            'TIME_PERIOD:Time period', 'value_clean'
-        ]].rename(columns={
-            'country_name': 'country_name',
-            'country_code': 'iso3_code',
-            'indicator_clean': 'indicator',
-            'TIME_PERIOD:Time period': 'year',
-            'value_clean': 'coverage_value'
+        result_df = pd.DataFrame({
+            'country_name': area_parts[1].str.strip().fillna(clean_df['REF_AREA:Geographic area'].str.strip()),
+            'iso3_code': area_parts[0].str.strip().where(has_code, 'UNKNOWN'),
+            # Clean indicator names - the code before the first colon (or the whole value)
+            'indicator': clean_df['INDICATOR:Indicator'].str.split(':', n=1).str[0],
+            'year': clean_df['TIME_PERIOD:Time period'],
+            # Values are parsed as numeric by the loader
+            'coverage_value': clean_df['OBS_VALUE:Observation Value']
         })
         
-        # Remove duplicates
-        result_df = result_df.drop_duplicates()
-        
-        # Standardize country names for merging
-        result_df['country_name'] = result_df['country_name'].str.strip()
-        result_df['iso3_code'] = result_df['iso3_code'].str.strip()
+        # Remove duplicates, renumbering rows like the other cleaned tables
+        result_df = result_df.drop_duplicates(ignore_index=True)
         
         # Filter for most recent estimate per country-indicator combination within 2018-2022
         print(f"    Before filtering for most recent estimates: {len(result_df)} records")
         
-        # Group by country and indicator, then get the most recent year for each
+        # Sort latest year first within each country and indicator, then keep the first row of each
+        result_df = result_df.dropna(subset=['country_name', 'indicator'])
         result_df = result_df.sort_values(['country_name', 'indicator', 'year'], ascending=[True, True, False])
-        result_df = result_df.groupby(['country_name', 'indicator']).first().reset_index()
+        result_df = result_df.drop_duplicates(subset=['country_name', 'indicator'], keep='first')
+        result_df = result_df[['country_name', 'indicator', 'iso3_code', 'year', 'coverage_value']].reset_index(drop=True)
         
+        self._print_unicef_summary(result_df)
+        
+        return result_df
+    
+    def _print_unicef_summary(self, result_df: pd.DataFrame):
+        """Print the counts and year distribution of the cleaned UNICEF estimates."""
         print(f"    After filtering for most recent estimates: {len(result_df)} records")
-        print(f"    Unique countries: {result_df['country_name'].nunique()}")
+        print(f"    Unique countries: {self._count_unique(result_df['country_name'])}")
         print(f"    Unique indicators: {result_df['indicator'].unique()}")
         
         # Show year distribution for verification
@@ -426,6 +451,58 @@ class DataCleaner:
         print(f"    Year distribution of most recent estimates:")
         for year, count in year_counts.items():
             print(f"      {year}: {count} estimates")
+    
+    def _clean_unicef_pl(self) -> pd.DataFrame:
+        """Clean UNICEF indicators data with a lazy Polars query (same output as clean_unicef_data)."""
+        print("  Processing UNICEF data with Polars...")
+        
+        file_path = self.data_paths['raw'] / "fusion_GLOBAL_DATAFLOW_UNICEF_1.0_.MNCH_ANC4+MNCH_SAB..csv"
+        if not file_path.exists():
+            raise FileNotFoundError(f"UNICEF data file not found: {file_path}")
+        
+        area = pl.col('REF_AREA:Geographic area')
+        area_parts = area.str.splitn(':', 2)
+        country = area_parts.struct.field('field_1')
+        
+        # Scan, filter and reduce in one plan; the year/value bounds run before any string work
+        lf = (
+            pl.scan_csv(file_path, schema_overrides={
+                'REF_AREA:Geographic area': pl.Utf8,
+                'INDICATOR:Indicator': pl.Utf8,
+                'TIME_PERIOD:Time period': pl.Int16,
+                'OBS_VALUE:Observation Value': pl.Float32
+            })
+            .select(list(UNICEF_DTYPES))
+            .filter(
+                pl.col('TIME_PERIOD:Time period').is_between(self.min_year, self.max_year) &
+                pl.col('OBS_VALUE:Observation Value').is_between(0, 100) &
+                pl.col('OBS_VALUE:Observation Value').is_not_nan()
+            )
+            .select(
+                # "CODE: Country Name" split at the first colon; without a colon keep the full name
+                country_name=pl.coalesce(country.str.strip_chars(), area.str.strip_chars()),
+                iso3_code=pl.when(country.is_not_null())
+                    .then(area_parts.struct.field('field_0').str.strip_chars())
+                    .otherwise(pl.lit('UNKNOWN')),
+                indicator=pl.col('INDICATOR:Indicator').str.splitn(':', 2).struct.field('field_0'),
+                year=pl.col('TIME_PERIOD:Time period'),
+                coverage_value=pl.col('OBS_VALUE:Observation Value')
+            )
+            .unique(maintain_order=True)
+            .drop_nulls(['country_name', 'indicator'])
+            # Latest year first within each country and indicator, then keep the first row of each
+            .sort(['country_name', 'indicator', 'year'], descending=[False, False, True], maintain_order=True)
+            .unique(subset=['country_name', 'indicator'], keep='first', maintain_order=True)
+            .select(['country_name', 'indicator', 'iso3_code', 'year', 'coverage_value'])
+        )
+        
+        # Hand pandas the same dtypes the pandas engine produces
+        result_df = lf.collect().to_pandas().astype({
+            'country_name': 'string[pyarrow]',
+            'iso3_code': 'string[pyarrow]'
+        })
+        
+        self._print_unicef_summary(result_df)
         
         return result_df
     
@@ -433,45 +510,17 @@ class DataCleaner:
         """Clean population data with unified column names for merging."""
         print("  Processing population data...")
         
-        clean_df = df.copy()
-        
-        key_columns = clean_df.attrs.get('key_columns', {})
-        
-        if not key_columns:
-            print("    Warning: No key column mapping found, attempting to identify columns...")
-            for col in clean_df.columns:
-                col_str = str(col).lower().strip()
-                if 'country' in col_str or 'area' in col_str:
-                    key_columns['country'] = col
-                elif 'iso3 alpha-code' in col_str:
-                    key_columns['iso3'] = col
-                elif 'year' in col_str:
-                    key_columns['year'] = col
-                elif 'births' in col_str and 'thousands' in col_str:
-                    key_columns['births_2022'] = col  # Use births as weights
-                elif 'population' in col_str and 'july' in col_str and 'thousands' in col_str:
-                    key_columns['population'] = col  # Keep for reference
-            # Handle the specific case where 'Year ' (with trailing space) exists
-            if 'Year ' in clean_df.columns:
-                key_columns['year'] = 'Year '
-            
-            # If still no key columns, use fallback positions
-            if not key_columns and len(clean_df.columns) >= 12:
-                print("    Using fallback column positions")
-                key_columns = {
-                    'country': clean_df.columns[2],  # Usually country name
-                    'year': clean_df.columns[10],    # Usually year
-                    'population': clean_df.columns[11]  # Usually population
-                }
+        # Mapping detected by the loader; detect it here only for frames loaded elsewhere
+        key_columns = df.attrs.get('key_columns') or self._identify_pop_key_columns(df.columns)
         
         print(f"    Using key columns: {key_columns}")
         
-        # Validate that we have the required columns
-        required_cols = ['country', 'year', 'births_2022']
+        # Validate that we have the required columns (ISO3 codes are the merge key)
+        required_cols = ['country', 'iso3', 'year', 'births_2022']
         missing_cols = [col for col in required_cols if col not in key_columns]
         if missing_cols:
             print(f"    Error: Missing required columns: {missing_cols}")
-            print(f"    Available columns: {list(clean_df.columns)}")
+            print(f"    Available columns: {list(df.columns)}")
             raise ValueError(f"Cannot proceed without required columns: {missing_cols}")
         
         year_col = key_columns['year']
@@ -479,48 +528,37 @@ class DataCleaner:
         births_col = key_columns['births_2022']
         
         # Filter for relevant years
-        clean_df = clean_df[
-            (clean_df[year_col] >= self.min_year) &
-            (clean_df[year_col] <= self.max_year)
-        ]
+        clean_df = df[df[year_col].between(self.min_year, self.max_year)]
         print(f"    Filtered to {len(clean_df)} records for years {self.min_year}-{self.max_year}")
         
-        # Extract country names and ISO codes
-        clean_df['country_name'] = clean_df[country_col].str.strip()
-        
-        # Handle ISO3 codes if available
-        if 'iso3' in key_columns:
-            iso3_col = key_columns['iso3']
-            clean_df['iso3_code'] = clean_df[iso3_col].str.strip()
-        else:
-            clean_df['iso3_code'] = 'UNKNOWN'
-        
-        # Convert births to numeric and filter for 2022 only
-        clean_df['births_2022'] = pd.to_numeric(clean_df[births_col], errors='coerce')
+        clean_df = clean_df.assign(
+            # Extract country names and ISO codes
+            country_name=clean_df[country_col].str.strip(),
+            iso3_code=clean_df[key_columns['iso3']].str.strip(),
+            # Convert births (thousands) to float32 numbers and filter for 2022 only
+            births_2022=pd.to_numeric(clean_df[births_col], errors='coerce').astype('float32')
+        )
         
         # Filter for 2022 births only (as specified in test requirements)
-        births_2022_data = clean_df[clean_df[year_col] == 2022].copy()
+        births_2022_data = clean_df[clean_df[year_col] == 2022]
         
         if len(births_2022_data) == 0:
             print(f"    Warning: No 2022 births data found. Using all years for births data.")
-            births_2022_data = clean_df.copy()
+            births_2022_data = clean_df
         
-        # Create unified column names for merging
-        result_df = births_2022_data[[
+        # Keep valid births in one mask, then deduplicate only the surviving rows
+        births = births_2022_data['births_2022'].to_numpy()
+        keep = ~np.isnan(births) & (births > 0)
+        result_df = births_2022_data.loc[keep, [
             'country_name', 'iso3_code', 'births_2022'
-        ]].copy()
-        
-        # Remove duplicates and invalid data
-        result_df = result_df.drop_duplicates()
-        result_df = result_df[result_df['births_2022'].notna()]
-        result_df = result_df[result_df['births_2022'] > 0]
+        ]].drop_duplicates(ignore_index=True)
         
         # Standardize country names for merging
         result_df['country_name'] = result_df['country_name'].str.strip()
         result_df['iso3_code'] = result_df['iso3_code'].str.strip()
         
         print(f"    Final cleaned data: {len(result_df)} records")
-        print(f"    Unique countries: {result_df['country_name'].nunique()}")
+        print(f"    Unique countries: {self._count_unique(result_df['country_name'])}")
         print(f"    Using 2022 projected births as weights")
         
         return result_df
@@ -529,40 +567,33 @@ class DataCleaner:
         """Clean U5MR classification data with unified column names for merging."""
         print("  Processing U5MR data...")
         
-        clean_df = df.copy()
-        
-        # Standardize country names
-        clean_df['country_name'] = clean_df['OfficialName'].str.strip()
-        clean_df['iso3_code'] = clean_df['ISO3Code'].str.strip()
-        
-        # Create binary classification for on-track vs off-track
-        def classify_status(status):
-            if pd.isna(status):
-                return 'unknown'
-            status_lower = str(status).lower()
-            if 'achieved' in status_lower or 'on-track' in status_lower:
-                return 'on_track'
-            elif 'acceleration' in status_lower or 'off-track' in status_lower:
-                return 'off_track'
-            else:
-                return 'unknown'
-        
-        clean_df['u5mr_status'] = clean_df['Status.U5MR'].apply(classify_status)
+        # Create binary classification for on-track vs off-track (missing statuses are unknown)
+        status_lower = df['Status.U5MR'].astype('string').str.lower()
+        on_track = (
+            status_lower.str.contains('achieved', regex=False, na=False) |
+            status_lower.str.contains('on-track', regex=False, na=False)
+        )
+        off_track = (
+            status_lower.str.contains('acceleration', regex=False, na=False) |
+            status_lower.str.contains('off-track', regex=False, na=False)
+        )
         
-        # Create unified column names for merging
-        result_df = clean_df[[
-            'country_name', 'iso3_code', 'u5mr_status'
-        ]].copy()
+        # Create unified column names for merging, with standardized country names
+        result_df = pd.DataFrame({
+            'country_name': df['OfficialName'].str.strip(),
+            'iso3_code': df['ISO3Code'].str.strip(),
+            'u5mr_status': np.select([on_track, off_track], ['on_track', 'off_track'], default='unknown')
+        }, index=df.index)
         
-        # Remove duplicates
-        result_df = result_df.drop_duplicates()
+        # Remove duplicates, renumbering rows like the other cleaned tables
+        result_df = result_df.drop_duplicates(ignore_index=True)
         
         # Show status distribution
         status_counts = result_df['u5mr_status'].value_counts()
         print(f"    Status distribution: {status_counts.to_dict()}")
         
         print(f"    Final cleaned data: {len(result_df)} records")
-        print(f"    Unique countries: {result_df['country_name'].nunique()}")
+        print(f"    Unique countries: {self._count_unique(result_df['country_name'])}")
         
         return result_df
     
@@ -578,29 +609,37 @@ class DataCleaner:
         print(f"    Population data: {len(population_df)} records")
         print(f"    U5MR data: {len(u5mr_df)} records")
         
-        # Step 1: Merge UNICEF and Population data on country only (births data is for 2022)
+        # Join on ISO3 codes rather than names, which differ across sources ("United States" vs
+        # "United States of America"); regional aggregates without a code never match
+        population_df = population_df[population_df['iso3_code'].notna()]
+        
+        # Categorical ISO3 keys sharing one dtype, so the joins compare integer codes
+        iso3_dtype = pd.CategoricalDtype(sorted(
+            set(unicef_df['iso3_code'].dropna()) |
+            set(population_df['iso3_code']) |
+            set(u5mr_df['iso3_code'].dropna())
+        ))
+        unicef_df = unicef_df.astype({'iso3_code': iso3_dtype, 'country_name': 'category', 'indicator': 'category'})
+        population_df = population_df.astype({'iso3_code': iso3_dtype})
+        u5mr_df = u5mr_df.astype({'iso3_code': iso3_dtype, 'u5mr_status': 'category'})
+        
+        # Index the right-hand frames by ISO3 once so both joins look keys up directly
+        population_idx = population_df.set_index('iso3_code')[['births_2022']]
+        u5mr_idx = u5mr_df.set_index('iso3_code')[['u5mr_status']]
+        
+        # Step 1: Merge UNICEF and Population data on ISO3 code only (births data is for 2022)
         print("    Step 1: Merging UNICEF and Population data...")
-        merged_df = pd.merge(
-            unicef_df, 
-            population_df, 
-            on=['country_name'], 
-            how='inner'
-        )
+        merged_df = unicef_df.join(population_idx, on='iso3_code', how='inner')
         print(f"    UNICEF + Population merge: {len(merged_df)} records")
         
-        # Step 2: Merge with U5MR data on country
+        # Step 2: Merge with U5MR data on ISO3 code
         print("    Step 2: Merging with U5MR classification...")
-        final_df = pd.merge(
-            merged_df,
-            u5mr_df[['country_name', 'u5mr_status']],
-            on='country_name',
-            how='left'
-        )
+        final_df = merged_df.join(u5mr_idx, on='iso3_code', how='left').reset_index(drop=True)
         print(f"    Final merged dataset: {len(final_df)} records")
         
         # Show merge statistics
         print(f"    Final columns: {list(final_df.columns)}")
-        print(f"    Unique countries in final dataset: {final_df['country_name'].nunique()}")
+        print(f"    Unique countries in final dataset: {self._count_unique(final_df['country_name'])}")
         print(f"    Unique indicators: {final_df['indicator'].unique()}")
         print(f"    Year range: {final_df['year'].min()} - {final_df['year'].max()}")
         
@@ -617,10 +656,20 @@ class DataCleaner:
         
         for name, df in cleaned_data.items():
             if name != 'merged':  # Don't save merged data yet
-                file_path = processed_path / f"{name}_cleaned.csv"
-                df.to_csv(file_path, index=False)
+                # Parquet keeps the string, float32 and int16 dtypes for later stages
+                file_path = processed_path / f"{name}_cleaned.parquet"
+                df.to_parquet(file_path, index=False, compression='snappy')
                 print(f"    Saved {name} cleaned data to {file_path}")
     
+    @staticmethod
+    def _count_unique(series: pd.Series) -> int:
+        """Count distinct non-null values, using the codes of categorical columns."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Categories can outlive the rows that used them (e.g. after the inner merge)
+            codes = series.cat.codes.to_numpy()
+            return int(np.count_nonzero(np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))))
+        return series.nunique()
+    
     def get_cleaning_summary(self, cleaned_data: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
         """Get summary of cleaning results."""
         summary = {}
@@ -629,7 +678,7 @@ class DataCleaner:
             summary[name] = {
                 'records': len(df),
                 'columns': list(df.columns),
-                'unique_countries': df['country_name'].nunique() if 'country_name' in df.columns else 0
+                'unique_countries': self._count_unique(df['country_name']) if 'country_name' in df.columns else 0
             }
         
         return summary 
\ No newline at end of file
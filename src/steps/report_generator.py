@@ -14,14 +14,338 @@ Key Functions:
 - save_results(): Save analysis results to files
 """
 
-import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Charts are only written to files; no GUI event loop needed
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+import os
 import json
+import hashlib
+import inspect
+import base64
+from string import Template
+from html import escape
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Charts are shown at most 1200px wide in the HTML report; tight_layout already
+# fits each figure, so savefig skips the extra bbox_inches='tight' render pass
+CHART_DPI = 150
+
+# zlib level for chart PNGs: much faster to encode than the default 6, files a little larger
+PNG_COMPRESS_LEVEL = 1
+
+# Results larger than this (characters of their text form) are saved as compact JSON
+COMPACT_JSON_THRESHOLD = 100_000
+
+# Chart colors for each U5MR status
+STATUS_COLORS = {
+    'on_track': '#2E8B57',
+    'off_track': '#CD5C5C',
+    'unknown': '#A9A9A9'
+}
+
+# Chart builder methods by visualization key, in report order
+CHART_METHODS = {
+    'coverage_comparison': '_create_coverage_comparison_chart',
+    'averages_comparison': '_create_averages_comparison_chart',
+    'coverage_distribution': '_create_coverage_distribution_chart',
+    'summary_chart': '_create_summary_chart'
+}
+
+# Static CSS of the HTML report
+HTML_STYLE = """
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 0 20px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #2c3e50;
+            text-align: center;
+            border-bottom: 3px solid #3498db;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #34495e;
+            border-left: 4px solid #3498db;
+            padding-left: 15px;
+        }
+        h3 {
+            color: #2c3e50;
+        }
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 20px;
+            margin: 20px 0;
+        }
+        .stat-card {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 20px;
+            border-radius: 10px;
+            text-align: center;
+        }
+        .stat-value {
+            font-size: 2em;
+            font-weight: bold;
+            margin: 10px 0;
+        }
+        .visualization {
+            text-align: center;
+            margin: 30px 0;
+        }
+        .visualization img {
+            max-width: 100%;
+            height: auto;
+            border-radius: 10px;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+        }
+        .interpretation {
+            background-color: #ecf0f1;
+            padding: 20px;
+            border-radius: 10px;
+            margin: 20px 0;
+        }
+        .caveats {
+            background-color: #fff3cd;
+            border: 1px solid #ffeaa7;
+            padding: 15px;
+            border-radius: 5px;
+            margin: 20px 0;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+        }
+        th, td {
+            padding: 12px;
+            text-align: left;
+            border-bottom: 1px solid #ddd;
+        }
+        th {
+            background-color: #3498db;
+            color: white;
+        }
+        tr:nth-child(even) {
+            background-color: #f2f2f2;
+        }
+    """
+
+# Page sections of the HTML report, compiled once at import
+HTML_HEAD = Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>UNICEF Health Services Coverage Analysis</title>
+    <style>""" + HTML_STYLE + """</style>
+</head>
+<body>
+    <div class="container">
+        <h1>UNICEF Health Services Coverage Analysis</h1>
+        <p><strong>Generated on:</strong> $generated</p>
+        
+        <h2>Executive Summary</h2>
+        <div class="stats-grid">
+            <div class="stat-card">
+                <h3>Total Countries</h3>
+                <div class="stat-value">$unique_countries</div>
+                <p>analyzed</p>
+            </div>
+            <div class="stat-card">
+                <h3>Total Births (2022)</h3>
+                <div class="stat-value">$total_births</div>
+                <p>covered</p>
+            </div>
+            <div class="stat-card">
+                <h3>Data Period</h3>
+                <div class="stat-value">$year_min-$year_max</div>
+                <p>years</p>
+            </div>
+            <div class="stat-card">
+                <h3>Indicators</h3>
+                <div class="stat-value">$num_indicators</div>
+                <p>analyzed</p>
+            </div>
+        </div>
+        
+        <h2>Population-Weighted Coverage Results</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Indicator</th>
+                    <th>Population-Weighted Average (%)</th>
+                    <th>Simple Average (%)</th>
+                    <th>Countries</th>
+                    <th>Coverage Range (%)</th>
+                </tr>
+            </thead>
+            <tbody>
+        """)
+
+HTML_STATUS_TABLE_HEAD = """
+            </tbody>
+        </table>
+        
+        <h2>Coverage by U5MR Status</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Status</th>
+                    <th>Indicator</th>
+                    <th>Population-Weighted Average (%)</th>
+                    <th>Countries</th>
+                    <th>Total Population</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+
+HTML_TAIL = Template("""
+            </tbody>
+        </table>
+        
+        <h2>Visualizations</h2>
+        
+        <div class="visualization">
+            <h3>Coverage Comparison by U5MR Status</h3>
+            <img src="$coverage_comparison" alt="Coverage Comparison">
+        </div>
+        
+        <div class="visualization">
+            <h3>Population-weighted vs Simple Averages</h3>
+            <img src="$averages_comparison" alt="Averages Comparison">
+        </div>
+        
+        <div class="visualization">
+            <h3>Coverage Distribution by Indicator</h3>
+            <img src="$coverage_distribution" alt="Coverage Distribution">
+        </div>
+        
+        <div class="visualization">
+            <h3>Summary Statistics</h3>
+            <img src="$summary_chart" alt="Summary Chart">
+        </div>
+        
+        <h2>Interpretation and Analysis</h2>
+        <div class="interpretation">
+            $interpretation
+        </div>
+        
+        <h2>Caveats and Assumptions</h2>
+        <div class="caveats">
+            <ul>
+                <li><strong>Data Quality:</strong> The analysis assumes UNICEF data represents the most recent available estimate per country-year.</li>
+                <li><strong>Population Data:</strong> Uses UN World Population Prospects 2022 for weighting calculations.</li>
+                <li><strong>Country Matching:</strong> Relies on consistent country identifiers across datasets.</li>
+                <li><strong>Missing Data:</strong> Countries with missing data are excluded from analysis.</li>
+                <li><strong>Time Period:</strong> Focuses on 2018-2022 as specified in requirements.</li>
+                <li><strong>U5MR Classification:</strong> Based on 2022 status classifications.</li>
+            </ul>
+        </div>
+        
+        <h2>Technical Details</h2>
+        <p><strong>Analysis Method:</strong> Population-weighted averages were calculated using the formula:</p>
+        <p style="text-align: center; font-family: monospace; background-color: #f8f9fa; padding: 10px; border-radius: 5px;">
+            Weighted Average = Σ(coverage_value × population) / Σ(population)
+        </p>
+        
+        <p><strong>Data Sources:</strong></p>
+        <ul>
+            <li>UNICEF Global Data Repository (ANC4 and SBA indicators)</li>
+            <li>UN World Population Prospects 2022 (population data)</li>
+            <li>Under-five Mortality Classification (U5MR status)</li>
+        </ul>
+        
+        <footer style="text-align: center; margin-top: 50px; padding-top: 20px; border-top: 1px solid #ddd; color: #666;">
+            <p>UNICEF Health Services Coverage Analysis | Generated for Technical Evaluation</p>
+        </footer>
+    </div>
+</body>
+</html>
+        """)
+
+# Table rows of the HTML report, filled with str.format_map per row
+OVERALL_ROW_TEMPLATE = """
+                <tr>
+                    <td><strong>{indicator}</strong></td>
+                    <td>{births_weighted_avg:.2f}%</td>
+                    <td>{simple_avg:.2f}%</td>
+                    <td>{num_countries}</td>
+                    <td>{min_coverage:.1f}% - {max_coverage:.1f}%</td>
+                </tr>
+            """
+
+STATUS_ROW_TEMPLATE = """
+                    <tr>
+                        <td><strong>{status}</strong></td>
+                        <td>{indicator}</td>
+                        <td>{births_weighted_avg:.2f}%</td>
+                        <td>{num_countries}</td>
+                        <td>{total_births:,.0f}</td>
+                    </tr>
+                """
+
+# Everything besides the results that shapes the chart files and the HTML report;
+# part of their cache keys, so edits here invalidate the cached output. The source of
+# the rendering methods is added by _source_digest, so code edits need no version bump
+CHART_RENDER_SETTINGS = [CHART_DPI, PNG_COMPRESS_LEVEL, STATUS_COLORS, CHART_METHODS]
+REPORT_RENDER_SETTINGS = [
+    HTML_STYLE, HTML_HEAD.template, HTML_STATUS_TABLE_HEAD,
+    HTML_TAIL.template, OVERALL_ROW_TEMPLATE, STATUS_ROW_TEMPLATE
+]
+
+# ReportGenerator methods whose source shapes the chart files and the HTML report
+CHART_CODE = ('_new_figure', *CHART_METHODS.values())
+REPORT_CODE = ('_create_html_report', '_chart_data_uri')
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the values json/orjson cannot: DataFrames as records, numpy scalars as Python numbers."""
+    if hasattr(value, 'to_dict'):
+        return value.to_dict('records')
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+@lru_cache(maxsize=None)
+def _source_digest(method_names: Tuple[str, ...]) -> str:
+    """Hash of the source code of the named ReportGenerator methods."""
+    source = ''.join(inspect.getsource(getattr(ReportGenerator, name)) for name in method_names)
+    return hashlib.blake2b(source.encode()).hexdigest()
+
+
+def _render_chart(method_name: str, results: Dict[str, Any], output_path: Path) -> str:
+    """Render one chart in a worker process (module-level so it can be pickled)."""
+    generator = ReportGenerator(results, output_path)
+    filename = getattr(generator, method_name)()
+    plt.close('all')
+    return filename
 
 
 class ReportGenerator:
@@ -33,9 +357,18 @@ class ReportGenerator:
         self.output_path = output_path
         self.output_path.mkdir(parents=True, exist_ok=True)
         
-        # Set up plotting style
+        # Set up plotting style (chart colors are set explicitly per chart)
         plt.style.use('default')
-        sns.set_palette("husl")
+        
+        # One figure, cleared and resized for each chart
+        self._fig = None
+        
+        # Content hash of the results and chart settings; chart files and the HTML report are keyed by it
+        self._cache_key = hashlib.blake2b(
+            json.dumps(
+                [results, CHART_RENDER_SETTINGS, _source_digest(CHART_CODE)], sort_keys=True, default=str
+            ).encode()
+        ).hexdigest()[:16]
     
     def create_visualizations(self) -> Dict[str, str]:
         """Create all visualizations for the report."""
@@ -43,88 +376,102 @@ class ReportGenerator:
         print("CREATING VISUALIZATIONS")
         print("="*80)
         
-        viz_files = {}
-        
-        # 1. Coverage comparison by U5MR status
-        viz_files['coverage_comparison'] = self._create_coverage_comparison_chart()
-        
-        # 2. Population-weighted vs simple averages
-        viz_files['averages_comparison'] = self._create_averages_comparison_chart()
-        
-        # 3. Coverage distribution by indicator
-        viz_files['coverage_distribution'] = self._create_coverage_distribution_chart()
-        
-        # 4. Summary statistics chart
-        viz_files['summary_chart'] = self._create_summary_chart()
+        # Charts already rendered for these results are reused as they are
+        viz_files = {key: self._chart_filename(key) for key in CHART_METHODS}
+        pending = [key for key, filename in viz_files.items() if not (self.output_path / filename).exists()]
+        for key, filename in viz_files.items():
+            if key not in pending:
+                print(f"  Reusing cached chart: {filename}")
+        
+        # The charts share no state, so with several cores each is rendered in its own process;
+        # a single chart or core renders in-process, reusing the shared figure
+        cpu_count = os.cpu_count() or 1
+        if pending:
+            if len(pending) == 1 or cpu_count == 1:
+                for key in pending:
+                    getattr(self, CHART_METHODS[key])()
+            else:
+                with ProcessPoolExecutor(max_workers=min(len(pending), cpu_count)) as executor:
+                    futures = [
+                        executor.submit(_render_chart, CHART_METHODS[key], self.results, self.output_path)
+                        for key in pending
+                    ]
+                    for future in futures:
+                        future.result()
+            
+            # Charts of earlier results are superseded by the ones just written
+            for key, filename in viz_files.items():
+                for stale in self.output_path.glob(f"{key}.*.png"):
+                    if stale.name != filename:
+                        stale.unlink()
         
         print("✓ All visualizations created successfully")
         return viz_files
     
+    def _chart_filename(self, name: str) -> str:
+        """File name of a chart for the current results, e.g. 'summary_chart.<key>.png'."""
+        return f"{name}.{self._cache_key}.png"
+    
+    def _chart_data_uri(self, filename: str) -> str:
+        """Inline a saved chart as a base64 PNG data URI, so the HTML report is a single file."""
+        encoded = base64.b64encode((self.output_path / filename).read_bytes()).decode('ascii')
+        return f"data:image/png;base64,{encoded}"
+    
+    def _new_figure(self, width: float, height: float):
+        """Return the shared figure, cleared and sized for the next chart."""
+        if self._fig is None:
+            self._fig = plt.figure(figsize=(width, height))
+        else:
+            self._fig.clf()
+            self._fig.set_size_inches(width, height)
+        return self._fig
+    
     def _create_coverage_comparison_chart(self) -> str:
         """Create chart comparing coverage for on-track vs off-track countries."""
         print("  Creating coverage comparison chart...")
         
         viz_data = self.results['data_for_visualization']
         
-        # Create the plot
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        # Coverage by (indicator, status), built in one pass over the visualization data
+        lookup = viz_data.set_index(['indicator', 'u5mr_status'])['coverage_value'].to_dict()
+        indicators = {indicator for indicator, _ in lookup}
+        status_order = ['on_track', 'off_track']
+        colors = [STATUS_COLORS[status] for status in status_order]
         
-        # ANC4 comparison
-        anc4_data = viz_data[viz_data['indicator'] == 'MNCH_ANC4']
-        if not anc4_data.empty:
-            status_order = ['on_track', 'off_track']
-            colors = ['#2E8B57', '#CD5C5C']
-            
-            bars1 = ax1.bar(
-                [status.replace('_', ' ').title() for status in status_order],
-                [anc4_data[anc4_data['u5mr_status'] == status]['coverage_value'].iloc[0] 
-                 if len(anc4_data[anc4_data['u5mr_status'] == status]) > 0 else 0 
-                 for status in status_order],
-                color=colors,
-                alpha=0.8
-            )
-            
-            # Add value labels on bars
-            for bar in bars1:
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                        f'{height:.1f}%', ha='center', va='bottom', fontweight='bold')
+        status_labels = [status.replace('_', ' ').title() for status in status_order]
+        
+        # Create the plot
+        fig = self._new_figure(15, 6)
+        axes = fig.subplots(1, 2)
+        
+        # One panel per indicator (ANC4, SBA), each read from the lookup
+        panels = [('MNCH_ANC4', 'ANC4'), ('MNCH_SAB', 'SBA')]
+        for ax, (indicator, label) in zip(axes, panels):
+            if indicator not in indicators:
+                continue
             
-            ax1.set_title('ANC4 Coverage by U5MR Status', fontsize=14, fontweight='bold')
-            ax1.set_ylabel('Coverage (%)', fontsize=12)
-            ax1.set_ylim(0, 100)
-            ax1.grid(axis='y', alpha=0.3)
-        
-        # SBA comparison
-        sba_data = viz_data[viz_data['indicator'] == 'MNCH_SAB']
-        if not sba_data.empty:
-            bars2 = ax2.bar(
-                [status.replace('_', ' ').title() for status in status_order],
-                [sba_data[sba_data['u5mr_status'] == status]['coverage_value'].iloc[0] 
-                 if len(sba_data[sba_data['u5mr_status'] == status]) > 0 else 0 
-                 for status in status_order],
+            bars = ax.bar(
+                status_labels,
+                [lookup.get((indicator, status), 0) for status in status_order],
                 color=colors,
                 alpha=0.8
             )
             
             # Add value labels on bars
-            for bar in bars2:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                        f'{height:.1f}%', ha='center', va='bottom', fontweight='bold')
+            ax.bar_label(bars, fmt='%.1f%%', padding=3, fontweight='bold')
             
-            ax2.set_title('SBA Coverage by U5MR Status', fontsize=14, fontweight='bold')
-            ax2.set_ylabel('Coverage (%)', fontsize=12)
-            ax2.set_ylim(0, 100)
-            ax2.grid(axis='y', alpha=0.3)
+            ax.set_title(f'{label} Coverage by U5MR Status', fontsize=14, fontweight='bold')
+            ax.set_ylabel('Coverage (%)', fontsize=12)
+            ax.set_ylim(0, 100)
+            ax.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the plot
-        filename = 'coverage_comparison.png'
+        filename = self._chart_filename('coverage_comparison')
         filepath = self.output_path / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filepath, dpi=CHART_DPI, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+        fig.clf()
         
         print(f"    Saved: {filepath}")
         return filename
@@ -133,45 +480,26 @@ class ReportGenerator:
         """Create chart comparing population-weighted vs simple averages."""
         print("  Creating averages comparison chart...")
         
-        # Prepare data
-        comparison_data = []
-        for indicator in self.results['overall_coverage'].keys():
-            overall = self.results['overall_coverage'][indicator]
-            comparison_data.append({
-                'indicator': indicator,
-                'type': 'Population-weighted',
-                'value': overall['births_weighted_avg']
-            })
-            comparison_data.append({
-                'indicator': indicator,
-                'type': 'Simple average',
-                'value': overall['simple_avg']
-            })
-        
-        comp_df = pd.DataFrame(comparison_data)
+        # Prepare data straight from the overall coverage results
+        overall_coverage = self.results['overall_coverage']
+        indicators = list(overall_coverage.keys())
+        weighted_vals = [overall_coverage[ind]['births_weighted_avg'] for ind in indicators]
+        simple_vals = [overall_coverage[ind]['simple_avg'] for ind in indicators]
         
         # Create the plot
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig = self._new_figure(10, 6)
+        ax = fig.subplots()
         
         # Create grouped bar chart
-        indicators = comp_df['indicator'].unique()
         x = np.arange(len(indicators))
         width = 0.35
         
-        weighted_vals = [comp_df[(comp_df['indicator'] == ind) & (comp_df['type'] == 'Population-weighted')]['value'].iloc[0] 
-                        for ind in indicators]
-        simple_vals = [comp_df[(comp_df['indicator'] == ind) & (comp_df['type'] == 'Simple average')]['value'].iloc[0] 
-                      for ind in indicators]
-        
         bars1 = ax.bar(x - width/2, weighted_vals, width, label='Population-weighted', color='#2E8B57', alpha=0.8)
         bars2 = ax.bar(x + width/2, simple_vals, width, label='Simple average', color='#4682B4', alpha=0.8)
         
         # Add value labels
         for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                       f'{height:.1f}%', ha='center', va='bottom', fontsize=10)
+            ax.bar_label(bars, fmt='%.1f%%', padding=3, fontsize=10)
         
         ax.set_xlabel('Health Service Indicator', fontsize=12)
         ax.set_ylabel('Coverage (%)', fontsize=12)
@@ -181,13 +509,13 @@ class ReportGenerator:
         ax.legend()
         ax.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the plot
-        filename = 'averages_comparison.png'
+        filename = self._chart_filename('averages_comparison')
         filepath = self.output_path / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filepath, dpi=CHART_DPI, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+        fig.clf()
         
         print(f"    Saved: {filepath}")
         return filename
@@ -196,49 +524,44 @@ class ReportGenerator:
         """Create chart showing coverage distribution by indicator."""
         print("  Creating coverage distribution chart...")
         
-        # This would require the original data for distribution analysis
-        # For now, create a summary chart
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        # Create summary table
-        summary_data = []
-        for indicator in self.results['overall_coverage'].keys():
-            overall = self.results['overall_coverage'][indicator]
-            summary_data.append({
-                'indicator': indicator,
-                'weighted_avg': overall['births_weighted_avg'],
-                'simple_avg': overall['simple_avg'],
-                'min_coverage': overall['min_coverage'],
-                'max_coverage': overall['max_coverage'],
-                'num_countries': overall['num_countries']
-            })
+        # The results hold per-indicator statistics, not per-country values, so the spread is
+        # shown as weighted/simple averages with min and max (the summary chart has none of these
+        # except the weighted average, so this chart is not a duplicate and is always rendered)
+        fig = self._new_figure(12, 6)
+        ax = fig.subplots()
         
-        summary_df = pd.DataFrame(summary_data)
+        # One array per statistic, read straight from the overall coverage results
+        overall_coverage = self.results['overall_coverage']
+        indicators = list(overall_coverage.keys())
+        stats = {
+            key: np.array([overall_coverage[ind][key] for ind in indicators])
+            for key in ('births_weighted_avg', 'simple_avg', 'min_coverage', 'max_coverage')
+        }
         
         # Create a comprehensive summary chart
-        x = np.arange(len(summary_df))
+        x = np.arange(len(indicators))
         width = 0.2
         
-        bars1 = ax.bar(x - width*1.5, summary_df['weighted_avg'], width, label='Population-weighted', color='#2E8B57')
-        bars2 = ax.bar(x - width*0.5, summary_df['simple_avg'], width, label='Simple average', color='#4682B4')
-        bars3 = ax.bar(x + width*0.5, summary_df['min_coverage'], width, label='Minimum', color='#CD5C5C')
-        bars4 = ax.bar(x + width*1.5, summary_df['max_coverage'], width, label='Maximum', color='#FFD700')
+        ax.bar(x - width*1.5, stats['births_weighted_avg'], width, label='Population-weighted', color='#2E8B57')
+        ax.bar(x - width*0.5, stats['simple_avg'], width, label='Simple average', color='#4682B4')
+        ax.bar(x + width*0.5, stats['min_coverage'], width, label='Minimum', color='#CD5C5C')
+        ax.bar(x + width*1.5, stats['max_coverage'], width, label='Maximum', color='#FFD700')
         
         ax.set_xlabel('Health Service Indicator', fontsize=12)
         ax.set_ylabel('Coverage (%)', fontsize=12)
         ax.set_title('Coverage Statistics by Indicator', fontsize=14, fontweight='bold')
         ax.set_xticks(x)
-        ax.set_xticklabels(summary_df['indicator'])
+        ax.set_xticklabels(indicators)
         ax.legend()
         ax.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the plot
-        filename = 'coverage_distribution.png'
+        filename = self._chart_filename('coverage_distribution')
         filepath = self.output_path / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filepath, dpi=CHART_DPI, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+        fig.clf()
         
         print(f"    Saved: {filepath}")
         return filename
@@ -247,19 +570,30 @@ class ReportGenerator:
         """Create summary chart with key statistics."""
         print("  Creating summary chart...")
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+        fig = self._new_figure(15, 10)
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
         # 1. Total countries by status
         status_dist = self.results['summary']['u5mr_status_distribution']
         status_labels = [k.replace('_', ' ').title() for k in status_dist.keys()]
         status_values = list(status_dist.values())
         
-        ax1.pie(status_values, labels=status_labels, autopct='%1.1f%%', startangle=90)
+        status_colors = [STATUS_COLORS.get(k, '#A9A9A9') for k in status_dist.keys()]
+        
+        # Percentages are part of the wedge labels, so pie() needs no autopct callback
+        total_countries = sum(status_values)
+        status_labels = [f"{label} ({100 * value / total_countries:.1f}%)"
+                         for label, value in zip(status_labels, status_values)]
+        
+        ax1.pie(status_values, labels=status_labels, colors=status_colors, startangle=90)
         ax1.set_title('Distribution of Countries by U5MR Status', fontweight='bold')
         
         # 2. Coverage range by indicator
         indicators = list(self.results['overall_coverage'].keys())
-        weighted_avgs = [self.results['overall_coverage'][ind]['births_weighted_avg'] for ind in indicators]
+        weighted_avgs = np.fromiter(
+            (self.results['overall_coverage'][ind]['births_weighted_avg'] for ind in indicators),
+            dtype=np.float64, count=len(indicators)
+        )
         
         bars = ax2.bar(indicators, weighted_avgs, color=['#2E8B57', '#4682B4'])
         ax2.set_title('Population-weighted Coverage by Indicator', fontweight='bold')
@@ -267,35 +601,33 @@ class ReportGenerator:
         ax2.grid(axis='y', alpha=0.3)
         
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{height:.1f}%', ha='center', va='bottom', fontweight='bold')
+        ax2.bar_label(bars, fmt='%.1f%%', padding=3, fontweight='bold')
         
         # 3. Year range
         year_range = self.results['summary']['year_range']
-        ax3.bar(['Min Year', 'Max Year'], [year_range['min'], year_range['max']], color=['#CD5C5C', '#FFD700'])
+        years = np.array([year_range['min'], year_range['max']], dtype=np.int64)
+        ax3.bar(['Min Year', 'Max Year'], years, color=['#CD5C5C', '#FFD700'])
         ax3.set_title('Data Year Range', fontweight='bold')
         ax3.set_ylabel('Year')
         ax3.grid(axis='y', alpha=0.3)
         
         # 4. Total population
         total_births = self.results['summary']['total_births'] / 1e6  # Convert to millions
-        ax4.bar(['Total Births'], [total_births], color='#9370DB')
+        births_bars = ax4.bar(['Total Births'], [total_births], color='#9370DB')
         ax4.set_title('Total Births (Millions)', fontweight='bold')
         ax4.set_ylabel('Births (Millions)')
         ax4.grid(axis='y', alpha=0.3)
         
         # Add value label
-        ax4.text(0, total_births + total_births*0.05, f'{total_births:.1f}M', ha='center', va='bottom', fontweight='bold')
+        ax4.bar_label(births_bars, fmt='%.1fM', padding=3, fontweight='bold')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the plot
-        filename = 'summary_chart.png'
+        filename = self._chart_filename('summary_chart')
         filepath = self.output_path / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filepath, dpi=CHART_DPI, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+        fig.clf()
         
         print(f"    Saved: {filepath}")
         return filename
@@ -306,22 +638,48 @@ class ReportGenerator:
         print("GENERATING COMPREHENSIVE REPORT")
         print("="*80)
         
-        # Create HTML report
-        html_content = self._create_html_report(viz_files)
-        
-        # Save HTML report
         html_filename = 'UNICEF_Health_Services_Analysis.html'
         html_filepath = self.output_path / html_filename
-        with open(html_filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
         
-        print(f"✓ HTML report saved: {html_filepath}")
+        # The first line of the report records the results, charts and templates it was built from
+        report_key = hashlib.blake2b(
+            json.dumps(
+                [self._cache_key, viz_files, REPORT_RENDER_SETTINGS, _source_digest(REPORT_CODE)], sort_keys=True
+            ).encode()
+        ).hexdigest()[:16]
+        key_line = f"<!-- report-key: {report_key} -->\n"
+        html_current = False
+        if html_filepath.exists():
+            with open(html_filepath, encoding='utf-8') as f:
+                html_current = f.readline() == key_line
+        
+        if html_current:
+            print(f"✓ HTML report unchanged: {html_filepath}")
+        else:
+            # Create HTML report
+            html_content = key_line + self._create_html_report(viz_files)
+            
+            # Save HTML report
+            html_filepath.write_text(html_content, encoding='utf-8')
+            
+            print(f"✓ HTML report saved: {html_filepath}")
         
         # Save results as JSON
         json_filename = 'analysis_results.json'
         json_filepath = self.output_path / json_filename
-        with open(json_filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, default=str)
+        # Indent small results for reading; large ones are written compactly
+        indent = sum(len(str(value)) for value in self.results.values()) <= COMPACT_JSON_THRESHOLD
+        
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            json_filepath.write_bytes(orjson.dumps(self.results, option=option, default=_json_default))
+        else:
+            json_filepath.write_text(
+                json.dumps(self.results, indent=2 if indent else None, default=_json_default),
+                encoding='utf-8'
+            )
         
         print(f"✓ Results saved as JSON: {json_filepath}")
         
@@ -338,252 +696,42 @@ class ReportGenerator:
         # Create interpretation text
         interpretation = self._create_interpretation_text()
         
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>UNICEF Health Services Coverage Analysis</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 0 20px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            text-align: center;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #34495e;
-            border-left: 4px solid #3498db;
-            padding-left: 15px;
-        }}
-        h3 {{
-            color: #2c3e50;
-        }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin: 20px 0;
-        }}
-        .stat-card {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            border-radius: 10px;
-            text-align: center;
-        }}
-        .stat-value {{
-            font-size: 2em;
-            font-weight: bold;
-            margin: 10px 0;
-        }}
-        .visualization {{
-            text-align: center;
-            margin: 30px 0;
-        }}
-        .visualization img {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 10px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-        }}
-        .interpretation {{
-            background-color: #ecf0f1;
-            padding: 20px;
-            border-radius: 10px;
-            margin: 20px 0;
-        }}
-        .caveats {{
-            background-color: #fff3cd;
-            border: 1px solid #ffeaa7;
-            padding: 15px;
-            border-radius: 5px;
-            margin: 20px 0;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{
-            background-color: #3498db;
-            color: white;
-        }}
-        tr:nth-child(even) {{
-            background-color: #f2f2f2;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>UNICEF Health Services Coverage Analysis</h1>
-        <p><strong>Generated on:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        
-        <h2>Executive Summary</h2>
-        <div class="stats-grid">
-            <div class="stat-card">
-                <h3>Total Countries</h3>
-                <div class="stat-value">{summary['unique_countries']}</div>
-                <p>analyzed</p>
-            </div>
-            <div class="stat-card">
-                <h3>Total Births (2022)</h3>
-                <div class="stat-value">{summary['total_births']:,.0f}</div>
-                <p>covered</p>
-            </div>
-            <div class="stat-card">
-                <h3>Data Period</h3>
-                <div class="stat-value">{summary['year_range']['min']}-{summary['year_range']['max']}</div>
-                <p>years</p>
-            </div>
-            <div class="stat-card">
-                <h3>Indicators</h3>
-                <div class="stat-value">{len(summary['indicators'])}</div>
-                <p>analyzed</p>
-            </div>
-        </div>
-        
-        <h2>Population-Weighted Coverage Results</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Indicator</th>
-                    <th>Population-Weighted Average (%)</th>
-                    <th>Simple Average (%)</th>
-                    <th>Countries</th>
-                    <th>Coverage Range (%)</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        for indicator, data in overall_coverage.items():
-            html += f"""
-                <tr>
-                    <td><strong>{indicator}</strong></td>
-                    <td>{data['births_weighted_avg']:.2f}%</td>
-                    <td>{data['simple_avg']:.2f}%</td>
-                    <td>{data['num_countries']}</td>
-                    <td>{data['min_coverage']:.1f}% - {data['max_coverage']:.1f}%</td>
-                </tr>
-            """
-        
-        html += """
-            </tbody>
-        </table>
-        
-        <h2>Coverage by U5MR Status</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Status</th>
-                    <th>Indicator</th>
-                    <th>Population-Weighted Average (%)</th>
-                    <th>Countries</th>
-                    <th>Total Population</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        for status, indicators in status_comparison.items():
-            for indicator, data in indicators.items():
-                html += f"""
-                    <tr>
-                        <td><strong>{status.replace('_', ' ').title()}</strong></td>
-                        <td>{indicator}</td>
-                        <td>{data['births_weighted_avg']:.2f}%</td>
-                        <td>{data['num_countries']}</td>
-                        <td>{data['total_births']:,.0f}</td>
-                    </tr>
-                """
-        
-        html += f"""
-            </tbody>
-        </table>
-        
-        <h2>Visualizations</h2>
-        
-        <div class="visualization">
-            <h3>Coverage Comparison by U5MR Status</h3>
-            <img src="{viz_files['coverage_comparison']}" alt="Coverage Comparison">
-        </div>
-        
-        <div class="visualization">
-            <h3>Population-weighted vs Simple Averages</h3>
-            <img src="{viz_files['averages_comparison']}" alt="Averages Comparison">
-        </div>
-        
-        <div class="visualization">
-            <h3>Coverage Distribution by Indicator</h3>
-            <img src="{viz_files['coverage_distribution']}" alt="Coverage Distribution">
-        </div>
-        
-        <div class="visualization">
-            <h3>Summary Statistics</h3>
-            <img src="{viz_files['summary_chart']}" alt="Summary Chart">
-        </div>
-        
-        <h2>Interpretation and Analysis</h2>
-        <div class="interpretation">
-            {interpretation}
-        </div>
-        
-        <h2>Caveats and Assumptions</h2>
-        <div class="caveats">
-            <ul>
-                <li><strong>Data Quality:</strong> The analysis assumes UNICEF data represents the most recent available estimate per country-year.</li>
-                <li><strong>Population Data:</strong> Uses UN World Population Prospects 2022 for weighting calculations.</li>
-                <li><strong>Country Matching:</strong> Relies on consistent country identifiers across datasets.</li>
-                <li><strong>Missing Data:</strong> Countries with missing data are excluded from analysis.</li>
-                <li><strong>Time Period:</strong> Focuses on 2018-2022 as specified in requirements.</li>
-                <li><strong>U5MR Classification:</strong> Based on 2022 status classifications.</li>
-            </ul>
-        </div>
-        
-        <h2>Technical Details</h2>
-        <p><strong>Analysis Method:</strong> Population-weighted averages were calculated using the formula:</p>
-        <p style="text-align: center; font-family: monospace; background-color: #f8f9fa; padding: 10px; border-radius: 5px;">
-            Weighted Average = Σ(coverage_value × population) / Σ(population)
-        </p>
-        
-        <p><strong>Data Sources:</strong></p>
-        <ul>
-            <li>UNICEF Global Data Repository (ANC4 and SBA indicators)</li>
-            <li>UN World Population Prospects 2022 (population data)</li>
-            <li>Under-five Mortality Classification (U5MR status)</li>
-        </ul>
+        # Every page-level value, computed once and shared by the head and tail sections
+        context = {
+            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'unique_countries': summary['unique_countries'],
+            'total_births': f"{summary['total_births']:,.0f}",
+            'year_min': summary['year_range']['min'],
+            'year_max': summary['year_range']['max'],
+            'num_indicators': len(summary['indicators']),
+            'interpretation': interpretation,
+            **{key: self._chart_data_uri(filename) for key, filename in viz_files.items()}
+        }
+        
+        # Assemble the page from the precompiled sections, joined once at the end
+        parts = [HTML_HEAD.substitute(context)]
+        
+        # Each table body is emitted in one join over its row template
+        parts.append(''.join(
+            OVERALL_ROW_TEMPLATE.format_map({**data, 'indicator': escape(indicator)})
+            for indicator, data in overall_coverage.items()
+        ))
+        
+        parts.append(HTML_STATUS_TABLE_HEAD)
+        
+        parts.append(''.join(
+            STATUS_ROW_TEMPLATE.format_map({
+                **data,
+                'status': escape(status.replace('_', ' ').title()),
+                'indicator': escape(indicator)
+            })
+            for status, indicators in status_comparison.items()
+            for indicator, data in indicators.items()
+        ))
         
-        <footer style="text-align: center; margin-top: 50px; padding-top: 20px; border-top: 1px solid #ddd; color: #666;">
-            <p>UNICEF Health Services Coverage Analysis | Generated for Technical Evaluation</p>
-        </footer>
-    </div>
-</body>
-</html>
-        """
+        parts.append(HTML_TAIL.substitute(context))
         
-        return html
+        return ''.join(parts)
     
     def _create_interpretation_text(self) -> str:
         """Create interpretation text based on the results."""
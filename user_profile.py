@@ -17,11 +17,44 @@ import sys
 import os
 import subprocess
 import platform
+import importlib.util
+import re
+from importlib.metadata import version, PackageNotFoundError
+import hashlib
+import time
+from functools import cached_property, lru_cache
 from pathlib import Path
 import logging
 from datetime import datetime
 
 
+# platform lookups can shell out (e.g. `uname -p`), so each is done once per process
+@lru_cache(maxsize=1)
+def _os_name():
+    """Operating system name and release."""
+    return f"{platform.system()} {platform.release()}"
+
+
+@lru_cache(maxsize=1)
+def _processor():
+    """Processor name as reported by the platform module."""
+    return platform.processor()
+
+
+@lru_cache(maxsize=1)
+def _platform_string():
+    """Full platform description for the configuration file."""
+    return platform.platform()
+
+
+class LazyFileHandler(logging.FileHandler):
+    """File handler that creates the log directory when it first opens the file."""
+    
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 class UserProfile:
     """Manages environment setup and configuration for reproducible analysis."""
     
@@ -34,18 +67,30 @@ class UserProfile:
         self.processed_dir = self.data_dir / 'processed'
         self.raw_dir = self.data_dir / 'raw'
         
+        # Markers of passed checks, so unchanged environments skip them on the next setup
+        self.cache_dir = self.project_root / '.cache'
+        
         # Required packages for the analysis
         self.required_packages = [
             'pandas>=1.3.0',
             'numpy>=1.20.0',
-            'matplotlib>=3.3.0',
-            'seaborn>=0.11.0',
+            'matplotlib>=3.4.0',
             'openpyxl>=3.0.0',
             'xlrd>=2.0.0',
             'streamlit>=1.28.0',
             'plotly>=5.15.0'
         ]
         
+        # (requirement, package name, minimum version), split once for check_dependencies
+        self.required_parsed = []
+        for package in self.required_packages:
+            package_name, _, minimum = package.partition('>=')
+            self.required_parsed.append((package, package_name, minimum))
+        
+        # Module names probed by validate_environment (dashboard modules are optional)
+        self.core_modules = ['pandas', 'numpy', 'matplotlib', 'openpyxl', 'xlrd']
+        self.dashboard_modules = ['streamlit', 'plotly']
+        
         # Required data files
         self.required_data_files = [
             'fusion_GLOBAL_DATAFLOW_UNICEF_1.0_.MNCH_ANC4+MNCH_SAB..csv',
@@ -66,13 +111,13 @@ class UserProfile:
     def setup_logging(self):
         """Configure logging for the analysis."""
         log_dir = self.project_root / 'logs'
-        log_dir.mkdir(exist_ok=True)
         
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(log_dir / 'analysis.log'),
+                # The logs folder and file are only created once a record is written
+                LazyFileHandler(log_dir / 'analysis.log', delay=True),
                 logging.StreamHandler(sys.stdout)
             ]
         )
@@ -96,9 +141,9 @@ class UserProfile:
     def check_system_info(self):
         """Display system information for reproducibility."""
         print("\nSYSTEM INFORMATION:")
-        print(f"  Operating System: {platform.system()} {platform.release()}")
+        print(f"  Operating System: {_os_name()}")
         print(f"  Machine: {platform.machine()}")
-        print(f"  Processor: {platform.processor()}")
+        print(f"  Processor: {_processor()}")
         print(f"  Python Location: {sys.executable}")
         print(f"  Working Directory: {self.project_root}")
     
@@ -108,16 +153,28 @@ class UserProfile:
         print("DEPENDENCY CHECK")
         print("="*80)
         
+        # Same package list, interpreter and version as the last passed check (within 24h): skip it
+        deps_digest = self._digest(*self.required_packages, sys.version, sys.executable)
+        if self._marker_is_fresh('deps.ok', deps_digest, max_age=24 * 3600):
+            print("✓ All required packages are installed (cached)")
+            return True
+        
         missing_packages = []
         
-        for package in self.required_packages:
-            package_name = package.split('>=')[0]
+        # Installed versions come from package metadata, so nothing is imported here
+        for package, package_name, minimum in self.required_parsed:
             try:
-                __import__(package_name)
-                print(f"✓ {package_name} is installed")
-            except ImportError:
+                installed = version(package_name)
+            except PackageNotFoundError:
                 missing_packages.append(package)
                 print(f"✗ {package_name} is missing")
+                continue
+            
+            if minimum and self._version_key(installed) < self._version_key(minimum):
+                missing_packages.append(package)
+                print(f"✗ {package_name} {installed} is older than {minimum}")
+            else:
+                print(f"✓ {package_name} {installed} is installed")
         
         if missing_packages:
             print(f"\nInstalling missing packages: {', '.join(missing_packages)}")
@@ -125,14 +182,84 @@ class UserProfile:
         else:
             print("\n✓ All required packages are installed")
         
+        self._write_marker('deps.ok', deps_digest)
         return True
     
+    @staticmethod
+    def _version_key(version_string):
+        """Comparable tuple of the numeric release parts, e.g. '1.28.0rc1' -> (1, 28)."""
+        match = re.match(r'\d+(?:\.\d+)*', version_string)
+        parts = [int(part) for part in match.group().split('.')] if match else []
+        # Trailing zeros do not change the version ('2.0' == '2.0.0')
+        while parts and parts[-1] == 0:
+            parts.pop()
+        return tuple(parts)
+    
+    @staticmethod
+    def _digest(*parts):
+        """Short BLAKE2b digest of the given values, used as a check marker's content."""
+        return hashlib.blake2b('\0'.join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    
+    def _marker_is_fresh(self, name, digest, max_age=None):
+        """Whether a check marker holds the given digest (and is younger than max_age seconds)."""
+        marker = self.cache_dir / name
+        try:
+            if marker.read_text().strip() != digest:
+                return False
+            return max_age is None or time.time() - marker.stat().st_mtime < max_age
+        except OSError:
+            return False
+    
+    def _write_marker(self, name, digest):
+        """Record a passed check so the next setup can skip it."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        (self.cache_dir / name).write_text(digest)
+    
+    @cached_property
+    def dashboard_present(self):
+        """Dashboard files found in the project root, from one directory scan per setup run."""
+        with os.scandir(self.project_root) as entries:
+            names = {entry.name for entry in entries}
+        return [file for file in self.dashboard_files if file in names]
+    
+    @cached_property
+    def path_strings(self):
+        """Project paths as strings, for the configuration file."""
+        return {
+            'project_root': str(self.project_root),
+            'data_dir': str(self.data_dir),
+            'raw_dir': str(self.raw_dir),
+            'processed_dir': str(self.processed_dir),
+            'output_dir': str(self.output_dir),
+            'src_dir': str(self.src_dir)
+        }
+    
+    @staticmethod
+    def _is_installed(module_name):
+        """Check that a module can be found without importing (executing) it."""
+        return importlib.util.find_spec(module_name) is not None
+    
     def install_packages(self, packages):
         """Install missing packages using pip."""
+        # One pip run resolves and downloads everything; wheels are cached in the project for re-runs
+        pip_command = [
+            sys.executable, '-m', 'pip', 'install',
+            '--disable-pip-version-check', '--no-input', '--prefer-binary'
+        ]
+        pip_env = {**os.environ, 'PIP_CACHE_DIR': str(self.project_root / '.pipcache')}
+        
+        try:
+            print(f"  Installing {', '.join(packages)}...")
+            subprocess.check_call(pip_command + list(packages), env=pip_env)
+            print(f"  ✓ {len(packages)} package(s) installed successfully")
+            return
+        except subprocess.CalledProcessError as e:
+            print(f"⚠️  Batched install failed ({e}); retrying packages one at a time")
+        
         try:
             for package in packages:
                 print(f"  Installing {package}...")
-                subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
+                subprocess.check_call(pip_command + [package], env=pip_env)
                 print(f"  ✓ {package} installed successfully")
         except subprocess.CalledProcessError as e:
             print(f"❌ Error installing packages: {e}")
@@ -153,8 +280,21 @@ class UserProfile:
             self.project_root / 'logs'
         ]
         
+        # Subdirectory names per parent, read with one scan so existing directories need no mkdir
+        existing = {}
         for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+            parent = directory.parent
+            if parent not in existing:
+                try:
+                    with os.scandir(parent) as entries:
+                        existing[parent] = {entry.name for entry in entries if entry.is_dir()}
+                except FileNotFoundError:
+                    existing[parent] = set()
+            
+            if directory.name not in existing[parent]:
+                os.makedirs(directory, exist_ok=True)
+                existing[parent].add(directory.name)
+                existing.setdefault(directory, set())  # Just created, so it is empty
             print(f"✓ Created/verified directory: {directory}")
         
         return True
@@ -165,18 +305,30 @@ class UserProfile:
         print("DATA FILES CHECK")
         print("="*80)
         
-        missing_files = []
+        # Sizes and modification times of the raw files, from one directory scan
+        try:
+            with os.scandir(self.raw_dir) as entries:
+                raw_stats = {entry.name: entry.stat() for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            raw_stats = {}
+        
+        missing_files = [filename for filename in self.required_data_files if filename not in raw_stats]
+        data_digest = self._digest(*(
+            (filename, raw_stats[filename].st_size, raw_stats[filename].st_mtime_ns)
+            for filename in self.required_data_files if filename in raw_stats
+        ))
+        data_cached = not missing_files and self._marker_is_fresh('data.ok', data_digest)
         
         for filename in self.required_data_files:
-            file_path = self.raw_dir / filename
-            if file_path.exists():
-                file_size = file_path.stat().st_size / 1024  # KB
+            if filename in raw_stats:
+                file_size = raw_stats[filename].st_size / 1024  # KB
                 print(f"✓ {filename} ({file_size:.1f} KB)")
             else:
-                missing_files.append(filename)
                 print(f"✗ {filename} - MISSING")
         
-        if missing_files:
+        if data_cached:
+            print("\n✓ All required data files are present (unchanged since last check)")
+        elif missing_files:
             print(f"\n⚠️  WARNING: Missing data files:")
             for file in missing_files:
                 print(f"    - {file}")
@@ -194,15 +346,14 @@ class UserProfile:
                 raise SystemError("Analysis requires data files to be present")
         else:
             print("\n✓ All required data files are present")
+            self._write_marker('data.ok', data_digest)
         
         # Check for dashboard files
         print(f"\nChecking dashboard files...")
-        dashboard_files_present = []
+        dashboard_files_present = self.dashboard_present
         for file in self.dashboard_files:
-            file_path = self.project_root / file
-            if file_path.exists():
+            if file in dashboard_files_present:
                 print(f"  ✓ {file}")
-                dashboard_files_present.append(file)
             else:
                 print(f"  ⚠️  {file} (optional)")
         
@@ -220,33 +371,33 @@ class UserProfile:
         print("ENVIRONMENT VALIDATION")
         print("="*80)
         
-        # Test imports
-        try:
-            import pandas as pd
-            import numpy as np
-            import matplotlib.pyplot as plt
-            import seaborn as sns
-            import openpyxl
-            import xlrd
-            print("✓ All required packages can be imported")
-            
-            # Test optional dashboard packages
-            try:
-                import streamlit
-                import plotly
-                print("✓ Dashboard packages available")
-            except ImportError:
-                print("⚠️  Dashboard packages not available (optional)")
-        except ImportError as e:
-            print(f"❌ Import error: {e}")
+        # Test that packages are importable; find_spec locates them without loading them
+        missing_modules = [name for name in self.core_modules if not self._is_installed(name)]
+        if missing_modules:
+            print(f"❌ Import error: missing {', '.join(missing_modules)}")
             return False
+        print("✓ All required packages can be imported")
         
-        # Test file operations
+        # Test optional dashboard packages
+        if all(self._is_installed(name) for name in self.dashboard_modules):
+            print("✓ Dashboard packages available")
+        else:
+            print("⚠️  Dashboard packages not available (optional)")
+        
+        # Test file operations; once a write test has passed for this output folder, a
+        # permission check is enough (the folder is identified by path and inode, as its mtime
+        # changes with every analysis run)
         try:
-            test_file = self.output_dir / 'test.txt'
-            test_file.write_text('test')
-            test_file.unlink()
-            print("✓ File operations work correctly")
+            output_stat = self.output_dir.stat()
+            env_digest = self._digest(self.output_dir, output_stat.st_dev, output_stat.st_ino)
+            if self._marker_is_fresh('env.ok', env_digest) and os.access(self.output_dir, os.W_OK):
+                print("✓ File operations work correctly (cached)")
+            else:
+                test_file = self.output_dir / 'test.txt'
+                test_file.write_text('test')
+                test_file.unlink()
+                self._write_marker('env.ok', env_digest)
+                print("✓ File operations work correctly")
         except Exception as e:
             print(f"❌ File operation error: {e}")
             return False
@@ -268,16 +419,9 @@ class UserProfile:
                 'description': 'Technical evaluation for Data and Analytics Education Team',
                 'created': datetime.now().isoformat(),
                 'python_version': f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-                'platform': platform.platform()
-            },
-            'paths': {
-                'project_root': str(self.project_root),
-                'data_dir': str(self.data_dir),
-                'raw_dir': str(self.raw_dir),
-                'processed_dir': str(self.processed_dir),
-                'output_dir': str(self.output_dir),
-                'src_dir': str(self.src_dir)
+                'platform': _platform_string()
             },
+            'paths': self.path_strings,
             'analysis_settings': {
                 'min_year': 2018,
                 'max_year': 2022,
@@ -285,7 +429,7 @@ class UserProfile:
                 'births_weighting': True
             },
             'dashboard': {
-                'available': len([f for f in self.dashboard_files if (self.project_root / f).exists()]) > 0,
+                'available': len(self.dashboard_present) > 0,
                 'files': self.dashboard_files,
                 'launch_command': 'streamlit run app.py'
             },
@@ -295,10 +439,15 @@ class UserProfile:
             }
         }
         
-        import json
+        # orjson is only probed here, when the file is actually written; the file stays
+        # indented because it is meant to be read and checked into the project
         config_file = self.project_root / 'analysis_config.json'
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        try:
+            import orjson
+            config_file.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        except ImportError:
+            import json
+            config_file.write_text(json.dumps(config, indent=2))
         
         print(f"✓ Configuration file created: {config_file}")
         return config_file
@@ -344,7 +493,7 @@ class UserProfile:
             print(f"  • Configuration: ✓ Created")
             
             # Check dashboard availability
-            dashboard_available = len([f for f in self.dashboard_files if (self.project_root / f).exists()]) > 0
+            dashboard_available = len(self.dashboard_present) > 0
             if dashboard_available:
                 print(f"  • Interactive dashboard: ✓ Available")
             else: